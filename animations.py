@@ -1,17 +1,18 @@
 import pygame
 from config import *
-from helpers import wrap_text
+from helpers import TypewriterText
 from ui_elements import Button
+from resources import resource_manager
+from timing import game_clock
 
 class CutsceneManager:
     def __init__(self, game_manager):
         self.gm = game_manager
         self.current_cutscene = None
         self.current_line = 0
-        self.current_text = ""
         self.text_progress = 0
+        self.typewriter = None  # Built on first draw of each line
         self.last_char_time = 0
-        self.font = pygame.font.Font(FONT_MEDIUM, FONT_SIZE_MD)
         # Skip button that transitions to appropriate next state
         self.skip_button = Button(
             WIDTH - 150, HEIGHT - 80, 100, 40, "Skip",
@@ -21,9 +22,8 @@ class CutsceneManager:
     def start_cutscene(self, cutscene_lines):
         self.current_cutscene = cutscene_lines
         self.current_line = 0
-        self.current_text = ""
         self.text_progress = 0
-        self.last_char_time = pygame.time.get_ticks()
+        self.last_char_time = game_clock.now()
         # Set appropriate game state based on cutscene type
         self.gm.set_game_state(STATE_CUTSCENE_INTRO if cutscene_lines == INTRO_CUTSCENE else STATE_CUTSCENE_OUTRO)
         self.gm.ui_manager.play_sound(CUTSCENE_THEME, 0.4)
@@ -35,9 +35,8 @@ class CutsceneManager:
         if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
             if self.current_line < len(self.current_cutscene) - 1:
                 self.current_line += 1
-                self.current_text = ""
                 self.text_progress = 0
-                self.last_char_time = pygame.time.get_ticks()
+                self.last_char_time = game_clock.now()
             else:
                 # End cutscene and transition to next state
                 if self.current_cutscene == INTRO_CUTSCENE:
@@ -47,12 +46,11 @@ class CutsceneManager:
                 self.current_cutscene = None
 
     def update(self):
-        # Typewriter effect - add one character at a time
+        # Typewriter effect - reveal one character at a time
         if self.current_cutscene and self.current_line < len(self.current_cutscene):
-            current_time = pygame.time.get_ticks()
+            current_time = game_clock.now()
             if current_time - self.last_char_time >= CUTSCENE_CHAR_DELAY:
                 if self.text_progress < len(self.current_cutscene[self.current_line]):
-                    self.current_text += self.current_cutscene[self.current_line][self.text_progress]
                     self.text_progress += 1
                     self.last_char_time = current_time
                 else:
@@ -69,9 +67,13 @@ class CutsceneManager:
             
             # Render wrapped text inside the dialog box
             message_rect = pygame.Rect(rect.x + 20, rect.y + 30, rect.width - 40, rect.height - 60)
-            y = wrap_text(surface, self.current_text, self.font, NEON_WHITE, message_rect)
+            text = self.current_cutscene[self.current_line]
+            if self.typewriter is None or self.typewriter.text != text or self.typewriter.shown > self.text_progress:
+                self.typewriter = TypewriterText(text, FONT_MEDIUM, FONT_SIZE_MD, NEON_WHITE, message_rect.width)
+            self.typewriter.show(self.text_progress)
+            y = self.typewriter.draw(surface, message_rect)
             
             # Show continue prompt
-            prompt = self.font.render("Press SPACE to continue", True, NEON_CYAN)
+            prompt = resource_manager.render_label("Press SPACE to continue", FONT_MEDIUM, FONT_SIZE_MD, NEON_CYAN)
             surface.blit(prompt, (WIDTH // 2 - prompt.get_width() // 2, HEIGHT - 50))
             self.skip_button.draw(surface)
\ No newline at end of file
@@ -0,0 +1,81 @@
+import pygame
+from config import ATLAS_PAGE_SIZE, ATLAS_MAX_PAGES
+
+class SpriteAtlas:
+    """Packs small, long-lived surfaces into shared per-pixel-alpha pages.
+    Sprites are placed on shelves: left to right along the current row, and
+    a new row starts below the tallest sprite once the row is full. Callers
+    get subsurfaces, so they blit them like any other surface.
+    Shelves can't reclaim single sprites, so once `max_pages` are full the
+    whole atlas is flushed and refills with what is still being drawn.
+    Callers must look sprites up each time rather than keep them."""
+    def __init__(self, page_size=ATLAS_PAGE_SIZE, padding=1, convert=None, max_pages=ATLAS_MAX_PAGES):
+        self.page_size = page_size
+        self.padding = padding
+        self.convert = convert  # Puts new pages in the display format
+        self.max_pages = max_pages
+        self.pages = []
+        self.sprites = {}
+        self.shelf_x = self.shelf_y = self.shelf_height = 0
+        self.standalone_area = 0  # Pixels held by sprites too large for a page
+        self.flushes = 0
+
+    def new_page(self):
+        page = pygame.Surface(self.page_size, pygame.SRCALPHA)
+        if self.convert:
+            page = self.convert(page)
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        self.shelf_x = self.shelf_y = self.shelf_height = 0
+        return page
+
+    def place(self, width, height):
+        """Returns (page, rect) for a free area, or None if the sprite is larger than a page."""
+        page_width, page_height = self.page_size
+        if width > page_width or height > page_height:
+            return None
+        if not self.pages:
+            self.new_page()
+        if self.shelf_x + width > page_width:
+            self.shelf_x = 0
+            self.shelf_y += self.shelf_height + self.padding
+            self.shelf_height = 0
+        if self.shelf_y + height > page_height:
+            if len(self.pages) >= self.max_pages:
+                self.clear()
+                self.flushes += 1
+            self.new_page()
+        rect = pygame.Rect(self.shelf_x, self.shelf_y, width, height)
+        self.shelf_x += width + self.padding
+        self.shelf_height = max(self.shelf_height, height)
+        return self.pages[-1], rect
+
+    def get(self, key):
+        return self.sprites.get(key)
+
+    def add(self, key, surface):
+        """Copies `surface` into the atlas and returns the subsurface that now holds it."""
+        spot = self.place(*surface.get_size())
+        if spot is None:
+            # Kept on its own, but its pixels count towards the same budget as the pages
+            width, height = surface.get_size()
+            page_width, page_height = self.page_size
+            self.standalone_area += width * height
+            if len(self.pages) * page_width * page_height + self.standalone_area > self.max_pages * page_width * page_height:
+                self.clear()
+                self.flushes += 1
+                self.standalone_area = width * height
+            self.sprites[key] = surface
+            return surface
+        page, rect = spot
+        # The area is fully transparent, so MAX copies the pixels, alpha included
+        page.blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        sprite = page.subsurface(rect)
+        self.sprites[key] = sprite
+        return sprite
+
+    def clear(self):
+        self.pages = []
+        self.sprites = {}
+        self.shelf_x = self.shelf_y = self.shelf_height = 0
+        self.standalone_area = 0
@@ -0,0 +1,146 @@
+import pygame
+import io
+import os
+from config import *
+from timing import game_clock
+from audio_cache import cached_path
+
+class SoundBank:
+    """Decodes sound effects once and plays them on per-category channel pools."""
+    def __init__(self, sound_files=SOUND_EFFECTS, channels=SOUND_CHANNELS, preload=True):
+        self.sounds = {}
+        self.pools = {}
+        self.channel_info = {}  # channel -> (start time, looping)
+        self.last_played = {}
+        self.enabled = pygame.mixer.get_init() is not None
+        if not self.enabled:
+            return
+        # Reserve the first channels so find_channel() never hands them out
+        total = sum(channels.values())
+        if pygame.mixer.get_num_channels() < total + 4:
+            pygame.mixer.set_num_channels(total + 4)
+        pygame.mixer.set_reserved(total)
+        index = 0
+        for category, count in channels.items():
+            self.pools[category] = [pygame.mixer.Channel(i) for i in range(index, index + count)]
+            index += count
+        if preload:
+            for sound_file in sound_files:
+                self.load(sound_file)
+
+    def load(self, sound_file):
+        """Returns the decoded sound, loading it from the audio cache the first time only."""
+        if sound_file in self.sounds:
+            return self.sounds[sound_file]
+        sound = None
+        if os.path.exists(sound_file):
+            try:
+                sound = pygame.mixer.Sound(cached_path(sound_file))
+            except pygame.error:
+                pass
+        self.sounds[sound_file] = sound
+        return sound
+
+    def get_channel(self, category):
+        # Use a free channel, otherwise steal the oldest one (one-shots before loops)
+        pool = self.pools.get(category) or self.pools.get("ui")
+        if not pool:
+            return None
+        for channel in pool:
+            if not channel.get_busy():
+                return channel
+        return min(pool, key=self.steal_priority)
+
+    def steal_priority(self, channel):
+        start_time, looping = self.channel_info.get(channel, (0, False))
+        return (looping, start_time)
+
+    def play(self, sound_file, volume, loops=0):
+        if not self.enabled:
+            return None
+        current_time = game_clock.now()
+        throttle = SOUND_THROTTLE.get(sound_file)
+        if throttle and current_time - self.last_played.get(sound_file, -throttle) < throttle:
+            return None
+        sound = self.load(sound_file)
+        if sound is None:
+            return None
+        channel = self.get_channel(SOUND_CATEGORIES.get(sound_file, "ui"))
+        if channel is None:
+            return None
+        channel.stop()
+        channel.set_volume(volume)
+        channel.play(sound, loops=loops)
+        self.channel_info[channel] = (current_time, loops != 0)
+        self.last_played[sound_file] = current_time
+        return channel
+
+    def stop(self, sound_file):
+        """Stops every reserved channel currently playing the given sound."""
+        sound = self.sounds.get(sound_file)
+        if sound is None:
+            return
+        for pool in self.pools.values():
+            for channel in pool:
+                if channel.get_sound() is sound:
+                    channel.stop()
+                    self.channel_info.pop(channel, None)
+
+class MusicManager:
+    """Streams one looping music track, switching with a fade out and fade in.
+    Track bytes are read into memory before playback, and a request for the
+    track that is already playing or queued is ignored."""
+    def __init__(self, tracks=MUSIC_TRACKS, fade_ms=MUSIC_FADE_MS, preload=True):
+        self.tracks = {}
+        self.volumes = tracks
+        self.fade_ms = fade_ms
+        self.target = None  # Track that should be playing
+        self.playing = None  # Track currently audible, None while fading out
+        self.enabled = pygame.mixer.get_init() is not None
+        if not self.enabled:
+            return
+        if preload:
+            for track in tracks:
+                self.load(track)
+
+    def load(self, track):
+        if track not in self.tracks and os.path.exists(track):
+            with open(track, "rb") as stream:
+                self.tracks[track] = stream.read()
+
+    def play(self, track):
+        if track == self.target or not self.enabled:
+            return
+        self.target = track
+        if pygame.mixer.music.get_busy():
+            # The new track starts from update() once the fade has finished
+            self.fade_out()
+        else:
+            self.start(track)
+
+    def stop(self):
+        self.target = None
+        if self.enabled and pygame.mixer.music.get_busy():
+            self.fade_out()
+
+    def fade_out(self):
+        if self.playing is not None:
+            pygame.mixer.music.fadeout(self.fade_ms)
+            self.playing = None
+
+    def start(self, track):
+        data = self.tracks.get(track)
+        if data is None:
+            # Not loaded yet; update() retries until the preloader has read it
+            return
+        try:
+            pygame.mixer.music.load(io.BytesIO(data), os.path.splitext(track)[1][1:])
+            pygame.mixer.music.set_volume(self.volumes[track])
+            pygame.mixer.music.play(-1, fade_ms=self.fade_ms)
+            self.playing = track
+        except pygame.error:
+            self.tracks.pop(track, None)
+
+    def update(self):
+        if self.enabled and self.target != self.playing and self.target and not pygame.mixer.music.get_busy():
+            self.start(self.target)
@@ -0,0 +1,89 @@
+"""Decoded audio cache.
+
+Sound effects are transcoded once to WAV in the mixer's native sample
+format and stored under AUDIO_CACHE_DIR. Each cache file name holds a
+hash of the source bytes and the mixer settings, so editing an asset or
+changing the mixer format picks up a fresh copy. Build the cache and
+compare load times with:
+    python audio_cache.py
+"""
+import argparse
+import glob
+import hashlib
+import os
+import time
+import wave
+import pygame
+from config import AUDIO_CACHE_DIR, SOUND_EFFECTS
+
+def cache_key(source, settings):
+    digest = hashlib.sha1()
+    with open(source, "rb") as stream:
+        for block in iter(lambda: stream.read(1 << 16), b""):
+            digest.update(block)
+    digest.update(repr(settings).encode("ascii"))
+    return digest.hexdigest()[:16]
+
+def transcode(source, target, settings):
+    """Decodes `source` with the mixer and writes its raw samples as a WAV file."""
+    frequency, size, channels = settings
+    sound = pygame.mixer.Sound(source)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    # Write to a temporary name first so an interrupted run never leaves a truncated entry
+    partial = target + ".part"
+    with wave.open(partial, "wb") as stream:
+        stream.setnchannels(channels)
+        stream.setsampwidth(abs(size) // 8)
+        stream.setframerate(frequency)
+        stream.writeframes(sound.get_raw())
+    os.replace(partial, target)
+
+def cached_path(source, cache_dir=AUDIO_CACHE_DIR):
+    """Returns the cached WAV for `source`, building it on first use.
+    Falls back to the source when the mixer format has no WAV equivalent."""
+    settings = pygame.mixer.get_init()
+    # WAV stores 16-bit samples as signed; 8-bit unsigned and float formats are left alone
+    if settings is None or settings[1] != -16 or not os.path.exists(source):
+        return source
+    stem = os.path.splitext(os.path.basename(source))[0]
+    target = os.path.join(cache_dir, f"{stem}-{cache_key(source, settings)}.wav")
+    if not os.path.exists(target):
+        try:
+            for stale in glob.glob(os.path.join(cache_dir, f"{stem}-*.wav")):
+                os.remove(stale)
+            transcode(source, target, settings)
+        except OSError:
+            # Read-only install or full disk: play the source directly
+            return source
+    return target
+
+def time_load(path, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        pygame.mixer.Sound(path)
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the decoded audio cache and report load times.")
+    parser.add_argument("--repeat", type=int, default=5, help="loads timed per file")
+    args = parser.parse_args()
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        # No audio device; decoding works the same on the dummy driver
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+        pygame.mixer.init()
+    print(f"mixer {pygame.mixer.get_init()}, cache in {AUDIO_CACHE_DIR}")
+    print(f"{'file':<24} {'source ms':>10} {'cached ms':>10} {'speedup':>8}")
+    totals = [0.0, 0.0]
+    for source in SOUND_EFFECTS:
+        target = cached_path(source)
+        before = time_load(source, args.repeat)
+        after = time_load(target, args.repeat)
+        totals[0] += before
+        totals[1] += after
+        print(f"{os.path.basename(source):<24} {before:>10.2f} {after:>10.2f} {before / after:>7.1f}x")
+    print(f"{'total':<24} {totals[0]:>10.2f} {totals[1]:>10.2f} {totals[0] / totals[1]:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Modular inverse micro-benchmark: recursive vs iterative vs pow() vs batched.
+
+Run from the repository root:
+    python -m benchmarks.bench_modinv [--bits 64 512] [--count 1000]
+"""
+import argparse
+import math
+import random
+import time
+from crypto import extended_gcd, mod_inverse, batch_mod_inverse
+
+DEFAULT_BITS = [16, 64, 256, 1024]
+
+def recursive_extended_gcd(a, b):
+    # Previous implementation of crypto.extended_gcd, kept as the baseline
+    if a == 0:
+        return b, 0, 1
+    gcd, x1, y1 = recursive_extended_gcd(b % a, a)
+    return gcd, y1 - (b // a) * x1, x1
+
+def recursive_mod_inverse(e, phi):
+    gcd, x, _ = recursive_extended_gcd(e, phi)
+    if gcd != 1:
+        raise ValueError("Modular inverse does not exist")
+    return (x % phi + phi) % phi
+
+def iterative_mod_inverse(e, phi):
+    gcd, x, _ = extended_gcd(e, phi)
+    if gcd != 1:
+        raise ValueError("Modular inverse does not exist")
+    return x % phi
+
+def make_inputs(bits, count):
+    modulus = random.getrandbits(bits) | (1 << (bits - 1)) | 1
+    values = []
+    while len(values) < count:
+        value = random.randrange(2, modulus)
+        if math.gcd(value, modulus) == 1:
+            values.append(value)
+    return values, modulus
+
+def time_call(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bits", type=int, nargs="+", default=DEFAULT_BITS)
+    parser.add_argument("--count", type=int, default=1000, help="inverses computed per size")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    print(f"{'bits':>6} {'recursive us':>13} {'iterative us':>13} {'pow us':>9} {'batched us':>11}")
+    for bits in args.bits:
+        values, modulus = make_inputs(bits, args.count)
+        timings = []
+        for func in (recursive_mod_inverse, iterative_mod_inverse, mod_inverse):
+            try:
+                elapsed, result = time_call(lambda: [func(value, modulus) for value in values])
+            except RecursionError:
+                timings.append(None)
+                continue
+            expected = result
+            timings.append(elapsed)
+        elapsed, result = time_call(lambda: batch_mod_inverse(values, modulus))
+        assert result == expected
+        timings.append(elapsed)
+        cells = [f"{'recursion':>13}" if t is None else f"{t * 1e6 / args.count:>13.2f}" for t in timings[:2]]
+        cells += [f"{timings[2] * 1e6 / args.count:>9.2f}", f"{timings[3] * 1e6 / args.count:>11.2f}"]
+        print(f"{bits:>6} " + " ".join(cells))
+
+if __name__ == "__main__":
+    main()
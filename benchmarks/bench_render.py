@@ -0,0 +1,162 @@
+"""Per-state rendering benchmark on SDL's dummy video and audio drivers.
+
+Renders every game state for a fixed number of frames and reports frame
+times, tracemalloc allocations and pygame.Surface constructions per
+frame. Run from the repository root:
+    python -m benchmarks.bench_render [--frames 300] [--save-baseline bench.json]
+    python -m benchmarks.bench_render --baseline bench.json [--threshold 0.25]
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+import tracemalloc
+import pygame
+from config import *
+from core import GameManager, Terminal
+from replay import KeyState
+from timing import game_clock
+
+WARMUP_FRAMES = 30
+# Metrics checked against a baseline; p99 is reported but too noisy to gate on
+METRICS = ["mean_ms", "p95_ms", "alloc_kb", "surfaces"]
+# Absolute slack per metric so near-zero baselines don't fail on noise
+SLACK = {"mean_ms": 0.05, "p95_ms": 0.1, "alloc_kb": 1.0, "surfaces": 0.5}
+
+class CountingSurface(pygame.Surface):
+    """Stands in for pygame.Surface to count constructions from Python code."""
+    created = 0
+
+    def __init__(self, *args, **kwargs):
+        CountingSurface.created += 1
+        super().__init__(*args, **kwargs)
+
+def gameplay_in(room_key):
+    def setup(gm):
+        gm.start_gameplay()
+        gm.set_current_room(room_key)
+        # Alarm flashing and the low-oxygen vignette on: the heaviest gameplay frame
+        gm.alarm_on = True
+        gm.alarm_visible = True
+        # Freeze the flash timer so the overlay stays on for every measured frame
+        gm.last_alarm_flash = math.inf
+        gm.player.oxygen = VIGNETTE_THRESHOLD - 1
+    return setup
+
+def open_puzzle(gm):
+    gm.start_gameplay()
+    terminal = next(obj for obj in gm.current_room.objects if isinstance(obj, Terminal))
+    terminal.interact(gm)
+
+def scenarios(gm):
+    yield STATE_MENU, lambda gm: gm.set_game_state(STATE_MENU)
+    yield STATE_HOW_TO_PLAY, lambda gm: gm.set_game_state(STATE_HOW_TO_PLAY)
+    yield STATE_CUTSCENE_INTRO, lambda gm: gm.start_intro_cutscene()
+    for room_key in gm.level.rooms:
+        yield f"{STATE_GAMEPLAY}:{room_key}", gameplay_in(room_key)
+    yield STATE_PUZZLE_RSA, open_puzzle
+    yield STATE_CUTSCENE_OUTRO, lambda gm: gm.start_final_cutscene()
+    yield STATE_GAME_OVER, lambda gm: gm.set_game_state(STATE_GAME_OVER)
+    yield STATE_WIN_SCREEN, lambda gm: gm.show_win_screen()
+
+def render_frame(gm, keys):
+    game_clock.advance(game_clock.step_ms)
+    while game_clock.step():
+        gm.update(keys)
+    gm.draw()
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def bench_scenario(gm, setup, frames):
+    keys = KeyState()
+    gm.reset_game()
+    setup(gm)
+    for _ in range(WARMUP_FRAMES):
+        render_frame(gm, keys)
+    # Timing pass without tracemalloc, which slows allocation-heavy code
+    times = []
+    CountingSurface.created = 0
+    for _ in range(frames):
+        start = time.perf_counter()
+        render_frame(gm, keys)
+        times.append((time.perf_counter() - start) * 1000)
+    surfaces = CountingSurface.created / frames
+    # Allocation pass: peak traced memory above the frame's starting level
+    tracemalloc.start()
+    allocated = []
+    for _ in range(frames):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        render_frame(gm, keys)
+        _, peak = tracemalloc.get_traced_memory()
+        allocated.append((peak - before) / 1024)
+    tracemalloc.stop()
+    return {
+        'mean_ms': statistics.mean(times),
+        'p95_ms': percentile(times, 0.95),
+        'p99_ms': percentile(times, 0.99),
+        'alloc_kb': statistics.mean(allocated),
+        'surfaces': surfaces
+    }
+
+def run(frames):
+    pygame.init()
+    original_surface = pygame.Surface
+    pygame.Surface = CountingSurface
+    try:
+        gm = GameManager(seed=0)
+        results = {name: bench_scenario(gm, setup, frames) for name, setup in scenarios(gm)}
+        gm.exit_game()
+    finally:
+        pygame.Surface = original_surface
+        pygame.quit()
+    return results
+
+def compare(results, baseline, threshold):
+    """Returns a line per metric that got worse than the baseline by more than `threshold`."""
+    regressions = []
+    for name, metrics in results.items():
+        if name not in baseline:
+            continue
+        for metric in METRICS:
+            old = baseline[name].get(metric)
+            if old is None:
+                continue
+            limit = old * (1 + threshold) + SLACK[metric]
+            if metrics[metric] > limit:
+                regressions.append(f"{name} {metric}: {metrics[metric]:.3f} > {limit:.3f} (baseline {old:.3f})")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300, help="measured frames per state")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write these results as a baseline")
+    args = parser.parse_args()
+    results = run(args.frames)
+    print(f"{'state':<30} {'mean ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'alloc KB':>9} {'surfaces':>9}")
+    for name, metrics in results.items():
+        print(f"{name:<30} {metrics['mean_ms']:>8.3f} {metrics['p95_ms']:>8.3f} {metrics['p99_ms']:>8.3f} "
+              f"{metrics['alloc_kb']:>9.1f} {metrics['surfaces']:>9.2f}")
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as stream:
+            json.dump(results, stream, indent=2)
+    if args.baseline:
+        with open(args.baseline) as stream:
+            regressions = compare(results, json.load(stream), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Key generation and decryption latency across RSA key sizes.
+
+Run from the repository root:
+    python -m benchmarks.bench_rsa [--bits 16 64 256] [--keys 5] [--ops 200]
+"""
+import argparse
+import random
+import time
+from crypto import PuzzleGenerator, mod_inverse, decrypt, crt_params, decrypt_crt
+
+DEFAULT_BITS = [16, 64, 128, 256, 512, 1024, 2048]
+
+def time_call(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+def bench_key_size(bits, keys, ops):
+    generator = PuzzleGenerator({"bench": bits})
+    gen_time = time_call(lambda: generator.generate_puzzle("bench"), keys)
+    puzzle = generator.generate_puzzle("bench")
+    p, q, e, c = puzzle['p'], puzzle['q'], puzzle['e'], puzzle['C']
+    n = p * q
+    d = mod_inverse(e, (p - 1) * (q - 1))
+    dp, dq, qinv = crt_params(p, q, d)
+    assert decrypt(c, d, n) == decrypt_crt(c, p, q, dp, dq, qinv) == int(puzzle['M_solution'])
+    plain_time = time_call(lambda: decrypt(c, d, n), ops)
+    crt_time = time_call(lambda: decrypt_crt(c, p, q, dp, dq, qinv), ops)
+    return gen_time, plain_time, crt_time
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bits", type=int, nargs="+", default=DEFAULT_BITS)
+    parser.add_argument("--keys", type=int, default=5, help="puzzles generated per key size")
+    parser.add_argument("--ops", type=int, default=200, help="decryptions timed per key size")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    print(f"{'bits':>6} {'generate ms':>12} {'pow ms':>10} {'crt ms':>10} {'speedup':>8}")
+    for bits in args.bits:
+        gen_time, plain_time, crt_time = bench_key_size(bits, args.keys, args.ops)
+        print(f"{bits:>6} {gen_time * 1000:>12.3f} {plain_time * 1000:>10.4f} {crt_time * 1000:>10.4f} {plain_time / crt_time:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Cold-start time to first frame.
+
+Launches the game in fresh interpreters on SDL's dummy drivers with
+--time-to-first-frame and reports when the first menu frame was drawn
+and when the background preloader finished. Run from the repository root:
+    python -m benchmarks.bench_startup [--runs 10] [--save-baseline startup.json]
+    python -m benchmarks.bench_startup --baseline startup.json [--threshold 0.25]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+METRICS = ["first_frame_ms", "assets_ready_ms"]
+SLACK_MS = 5.0  # Absolute slack so small timings don't fail on noise
+
+def launch():
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "main.py", "--time-to-first-frame"], env=env, check=True, capture_output=True, text=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result['process_ms'] = (time.perf_counter() - start) * 1000
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative regression of the median")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write these results as a baseline")
+    args = parser.parse_args()
+    runs = [launch() for _ in range(args.runs)]
+    results = {}
+    print(f"{'metric':<18} {'median':>8} {'min':>8} {'max':>8}")
+    for metric in METRICS + ["process_ms"]:
+        values = [run[metric] for run in runs]
+        results[metric] = statistics.median(values)
+        print(f"{metric:<18} {results[metric]:>8.1f} {min(values):>8.1f} {max(values):>8.1f}")
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as stream:
+            json.dump(results, stream, indent=2)
+    if args.baseline:
+        with open(args.baseline) as stream:
+            baseline = json.load(stream)
+        regressions = []
+        for metric in METRICS:
+            limit = baseline[metric] * (1 + args.threshold) + SLACK_MS
+            if results[metric] > limit:
+                regressions.append(f"{metric}: {results[metric]:.1f} > {limit:.1f} (baseline {baseline[metric]:.1f})")
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,21 @@
-import pygame
 import os
 
 # Screen Settings
 WIDTH = 960
 HEIGHT = 540
-FPS = 60
+FPS = 60  # Render rate cap
+SIM_RATE = 60  # Fixed simulation steps per second
+SIM_STEP_MS = 1000 / SIM_RATE
+MAX_FRAME_MS = 250  # Longest frame the simulation catches up on
+DIRTY_RECT_RENDERING = False  # Update only changed regions instead of flipping the whole screen
+
+# Profiler Settings
+PROFILER_CAPACITY = 600  # Frames kept in the profiler ring buffer
+PROFILER_GRAPH_SIZE = (240, 80)  # Overlay frame-time graph in pixels, one column per frame
+PROFILER_GRAPH_MAX_MS = 40  # Frame time at the top of the graph
+PROFILER_STATS_INTERVAL = 30  # Frames between overlay percentile refreshes
+PROFILE_DUMP_DIR = "profiles"  # Where the dump hotkey writes the buffer
+PROFILE_DUMP_FORMAT = "csv"  # "csv" or "json"
 
 # Colors (Neon Sci-Fi Palette)
 NEON_BLACK = (20, 20, 30)
@@ -39,6 +50,10 @@ STATE_GAME_OVER = "GAME_OVER"
 STATE_WIN_SCREEN = "WIN_SCREEN"
 STATE_HOW_TO_PLAY = "HOW_TO_PLAY"
 
+# Level Data
+LEVEL_PATH = os.path.join("Assets", "Levels", "station.json")
+ROOM_CACHE_SIZE = 8  # Rooms that keep their pre-rendered background
+
 # Font Paths
 FONT_DIR = os.path.join("Assets", "Fonts", "Orbitron")
 FONT_BLACK = os.path.join(FONT_DIR, "Orbitron-Black.ttf")
@@ -58,11 +73,29 @@ TERMINAL_ERROR = os.path.join(AUDIO_DIR, "terminal_error.mp3")
 LOW_OXYGEN_ALERT = os.path.join(AUDIO_DIR, "low_oxygen_alert.mp3")
 PLAYER_DEATH = os.path.join(AUDIO_DIR, "player_death.mp3")
 
+# Sound Bank (effects are decoded once and played on reserved channels)
+SOUND_EFFECTS = [INTERACT_SOUND, UNLOCK_SOUND, TERMINAL_TYPING, TERMINAL_SUCCESS, TERMINAL_ERROR, LOW_OXYGEN_ALERT, PLAYER_DEATH, CUTSCENE_THEME]
+SOUND_CHANNELS = {"ui": 4, "alerts": 2, "typing": 2, "cutscene": 1}  # Reserved channels per category
+SOUND_CATEGORIES = {
+    TERMINAL_TYPING: "typing",
+    TERMINAL_ERROR: "alerts",
+    LOW_OXYGEN_ALERT: "alerts",
+    PLAYER_DEATH: "alerts",
+    CUTSCENE_THEME: "cutscene"
+}  # Sounds not listed here play on "ui" channels
+SOUND_THROTTLE = {TERMINAL_TYPING: 40}  # Minimum ms between repeated triggers
+AUDIO_CACHE_DIR = os.path.join("Assets", "AudioCache")  # Effects transcoded to the mixer's WAV format (see audio_cache.py)
+
+# Music (streamed from memory, one track at a time)
+MUSIC_TRACKS = {MENU_MUSIC: 0.3, STATION_AMBIENCE: 0.2}  # Streamed tracks and their volumes
+MUSIC_FADE_MS = 600  # Fade out and fade in when the track changes
+
 # Font Sizes
 FONT_SIZE_SM = 12
 FONT_SIZE_MD = 16
 FONT_SIZE_LG = 22
 FONT_SIZE_XL = 28
+PRELOAD_FONTS = [(FONT_MEDIUM, FONT_SIZE_SM), (FONT_MEDIUM, FONT_SIZE_MD), (FONT_BOLD, FONT_SIZE_LG), (FONT_BOLD, FONT_SIZE_XL)]  # Loaded at startup by the preloader
 
 # Game Mechanics
 PLAYER_SPEED = 3
@@ -78,14 +111,32 @@ OXYGEN_DEPLETION_RATE = 0.05  # Oxygen depletion rate per second
 SUIT_DAMAGE_RATE = 0.01  # Suit damage rate per second
 GLOW_SPEED = 0.05  # Speed of neon glow pulse
 
+# Puzzle Generation
+PUZZLE_DIFFICULTY = "normal"
+PUZZLE_POOL_SIZE = 6  # Ready puzzles kept per difficulty
+PUZZLE_POOL_DIFFICULTIES = ["normal"]
+PRIME_TIERS = {"easy": (4, 5), "normal": (4, 7), "advanced": (8, 10)}  # Prime bit lengths per difficulty
+RSA_KEY_TIERS = {"hard": 16, "expert": 128, "hacker": 1024}  # Modulus bits for large-key modes
+PUZZLE_INDEX_PATH = os.path.join("Assets", "Puzzles", "puzzle_index.bin")  # Built by puzzle_index.py
+PUZZLE_INDEX_MAX_E = 2048  # Public exponents kept per prime pair in the index
+PUZZLE_INDEX_DIFFICULTIES = ["easy", "normal", "hard"]  # Difficulties written to the index by default
+
 # UI Settings
 BUTTON_GLOW_INTENSITY = 50
 PARTICLE_COUNT = 50
 PARTICLE_SPEED = 0.5
+PARTICLE_ALPHA_LEVELS = 4  # Pre-rendered glow sprites per particle size
+PARTICLE_STATES = [STATE_MENU, STATE_HOW_TO_PLAY, STATE_GAME_OVER, STATE_WIN_SCREEN]  # States that show particles
 MESSAGE_FADE_DURATION = 500
 HUD_PANEL_ALPHA = 150
+HUD_RECT = (10, 10, 220, 100)  # Oxygen and suit status panel
 MINI_MAP_RADIUS = 60
 VIGNETTE_THRESHOLD = 30
+SPATIAL_CELL_SIZE = 64  # Grid cell size for room interaction lookups
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept by the resource manager
+LAYOUT_CACHE_SIZE = 128  # Wrapped line layouts kept by helpers.layout_lines
+ATLAS_PAGE_SIZE = (512, 512)  # Sprite atlas page; larger surfaces are kept on their own
+ATLAS_MAX_PAGES = 4  # The atlas is flushed and refilled once this many pages are full
 
 # Cutscene Scripts
 INTRO_CUTSCENE = [
@@ -1,26 +1,38 @@
 import pygame
+import random
+import threading
 from config import *
 from ui_elements import UIManager, Button
 from animations import CutsceneManager
-from crypto import PuzzleGenerator
+from crypto import PuzzleGenerator, PuzzlePool
+from puzzle_index import PuzzleIndex
 from helpers import wrap_text
+from resources import resource_manager
+from renderer import DirtyRectRenderer
+from profiler import profiler
+from level import LevelData
+from collections import OrderedDict
+from timing import game_clock
+from preloader import Preloader
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
         # player sprite appearance
-        self.image = pygame.Surface((25, 25))
+        self.image = resource_manager.convert(pygame.Surface((25, 25)))
         self.image.fill(NEON_GREEN)
         self.rect = self.image.get_rect(topleft=(x, y))
-        self.speed = PLAYER_SPEED
+        self.previous_pos = self.rect.topleft  # Position before the last simulation step
+        self.speed = PLAYER_SPEED  # Pixels per simulation step
         
         # health system
         self.oxygen = 100.0
         self.suit_integrity = 100.0
-        self.last_oxygen_tick = pygame.time.get_ticks()
+        self.last_oxygen_tick = game_clock.now()
         self.is_alive = True
 
     def update(self, keys):
+        self.previous_pos = self.rect.topleft
         if not self.is_alive:
             return
             
@@ -46,7 +58,7 @@ class Player(pygame.sprite.Sprite):
         self.rect.bottom = min(HEIGHT - 50, self.rect.bottom)
         
         # Update health every second
-        if pygame.time.get_ticks() - self.last_oxygen_tick >= 1000:
+        if game_clock.now() - self.last_oxygen_tick >= 1000:
             if moved:
                 # Movement damages suit
                 self.suit_integrity -= SUIT_DAMAGE_RATE
@@ -54,14 +66,25 @@ class Player(pygame.sprite.Sprite):
             if self.suit_integrity < 100:
                 # Damaged suit causes oxygen loss
                 self.oxygen -= OXYGEN_DEPLETION
-            self.last_oxygen_tick = pygame.time.get_ticks()
+            self.last_oxygen_tick = game_clock.now()
             
             # Check for death conditions
             if self.oxygen <= 0 or self.suit_integrity <= 0:
                 self.is_alive = False
 
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, alpha=1.0):
+        # Interpolate between the last two simulation steps
+        x = self.previous_pos[0] + (self.rect.x - self.previous_pos[0]) * alpha
+        y = self.previous_pos[1] + (self.rect.y - self.previous_pos[1]) * alpha
+        surface.blit(self.image, (round(x), round(y)))
+
+    def get_dirty_rect(self):
+        return self.rect.union(self.image.get_rect(topleft=self.previous_pos))
+
+    def teleport(self, x, y):
+        # Moves without interpolating across the screen
+        self.rect.topleft = (x, y)
+        self.previous_pos = self.rect.topleft
 
     def reset(self):
         # Reset player to starting state
@@ -70,13 +93,14 @@ class Player(pygame.sprite.Sprite):
         self.oxygen = 100.0
         self.suit_integrity = 100.0
         self.is_alive = True
-        self.last_oxygen_tick = pygame.time.get_ticks()
+        self.last_oxygen_tick = game_clock.now()
+        self.previous_pos = self.rect.topleft
 
 class Door(pygame.sprite.Sprite):
     def __init__(self, x, y, width, height, target_room, target_x, target_y):
         super().__init__()
         # Create door appearance
-        self.image = pygame.Surface((width, height))
+        self.image = resource_manager.convert(pygame.Surface((width, height)))
         self.image.fill(NEON_BLUE)
         self.rect = self.image.get_rect(topleft=(x, y))
         self.name = f"Door to {target_room.replace('_', ' ').title()}"
@@ -91,7 +115,6 @@ class Door(pygame.sprite.Sprite):
         # Visual effects
         self.pulse_alpha = 0
         self.pulse_start = 0
-        self.font = pygame.font.Font(FONT_MEDIUM, FONT_SIZE_SM)
 
     def update_color(self):
         self.image.fill(self.unlocked_color if not self.is_locked else NEON_BLUE)
@@ -99,7 +122,7 @@ class Door(pygame.sprite.Sprite):
     def update(self):
         # Handle unlock pulse animation
         if not self.is_locked and self.pulse_start:
-            elapsed = pygame.time.get_ticks() - self.pulse_start
+            elapsed = game_clock.now() - self.pulse_start
             if elapsed < DOOR_PULSE_DURATION:
                 self.pulse_alpha = int(100 * (1 - elapsed / DOOR_PULSE_DURATION))
             else:
@@ -115,8 +138,7 @@ class Door(pygame.sprite.Sprite):
                 game_manager.start_final_cutscene()
             else:
                 game_manager.set_current_room(self.target_room)
-                player.rect.x = self.target_x
-                player.rect.y = self.target_y
+                player.teleport(self.target_x, self.target_y)
         else:
             game_manager.set_game_message("Door Locked. Decrypt terminal.", NEON_RED)
 
@@ -124,7 +146,7 @@ class Door(pygame.sprite.Sprite):
         # Unlock door and start visual effects
         self.is_locked = False
         self.update_color()
-        self.pulse_start = pygame.time.get_ticks()
+        self.pulse_start = game_clock.now()
         game_manager.ui_manager.play_sound(UNLOCK_SOUND, 0.5)
 
     def draw(self, surface):
@@ -132,14 +154,23 @@ class Door(pygame.sprite.Sprite):
         
         # Draw pulse effect when unlocked
         if self.pulse_alpha > 0:
-            pulse_surface = pygame.Surface((self.rect.width + 10, self.rect.height + 10), pygame.SRCALPHA)
-            pygame.draw.rect(pulse_surface, (0, 255, 255, self.pulse_alpha), (5, 5, self.rect.width, self.rect.height), border_radius=5)
+            pulse_surface = resource_manager.get_sprite(("door_pulse", self.rect.size), self.build_pulse)
+            pulse_surface.set_alpha(self.pulse_alpha)
             surface.blit(pulse_surface, (self.rect.x - 5, self.rect.y - 5))
         
         # Draw door label
-        label = self.font.render(self.name, True, NEON_WHITE)
+        label = resource_manager.render_label(self.name, FONT_MEDIUM, FONT_SIZE_SM, NEON_WHITE)
         surface.blit(label, (self.rect.centerx - label.get_width() // 2, self.rect.top - 20))
 
+    def build_pulse(self):
+        pulse_surface = pygame.Surface((self.rect.width + 10, self.rect.height + 10), pygame.SRCALPHA)
+        pygame.draw.rect(pulse_surface, (0, 255, 255, 255), (5, 5, self.rect.width, self.rect.height), border_radius=5)
+        return pulse_surface
+
+    def get_dirty_rect(self):
+        # Only the unlock pulse animates while the player is in the room
+        return self.rect.inflate(10, 10) if self.pulse_alpha > 0 else None
+
     def reset(self):
         # Reset door to locked state
         self.is_locked = True
@@ -150,7 +181,7 @@ class Door(pygame.sprite.Sprite):
 class Terminal(pygame.sprite.Sprite):
     def __init__(self, x, y, puzzle_generator, unlocks_door=None, is_final=False):
         super().__init__()
-        self.image = pygame.Surface((70, 100))
+        self.image = resource_manager.convert(pygame.Surface((70, 100)))
         self.image.fill(NEON_RED)
         self.rect = self.image.get_rect(topleft=(x, y))
         self.name = "Distress Terminal" if is_final else ("Control Terminal" if unlocks_door else "Terminal")
@@ -168,11 +199,10 @@ class Terminal(pygame.sprite.Sprite):
         self.message_time = 0
         self.cursor_blink = True
         self.last_blink = 0
-        self.font = pygame.font.Font(FONT_MEDIUM, FONT_SIZE_SM)
         self.generate_puzzle()
 
     def generate_puzzle(self):
-        self.puzzle_data = self.puzzle_generator.generate_puzzle()
+        self.puzzle_data = self.puzzle_generator.generate_puzzle(PUZZLE_DIFFICULTY)
         self.solution = self.puzzle_data['M_solution']
         self.update_message()
 
@@ -190,10 +220,10 @@ class Terminal(pygame.sprite.Sprite):
             self.current_message = ["Terminal decrypted! Press ESC to exit."]
             
     def update(self):
-        if pygame.time.get_ticks() - self.last_blink >= 500:
+        if game_clock.now() - self.last_blink >= 500:
             self.cursor_blink = not self.cursor_blink
-            self.last_blink = pygame.time.get_ticks()
-        if self.message_time and pygame.time.get_ticks() > self.message_time:
+            self.last_blink = game_clock.now()
+        if self.message_time and game_clock.now() > self.message_time:
             self.update_message()
             self.message_time = 0
 
@@ -239,49 +269,53 @@ class Terminal(pygame.sprite.Sprite):
 
     def set_temp_message(self, message, color, duration=MESSAGE_DURATION):
         self.current_message = [message]
-        self.message_time = pygame.time.get_ticks() + duration
+        self.message_time = game_clock.now() + duration
 
     def draw(self, surface):
         surface.blit(self.image, self.rect)
-        mini_screen = pygame.Surface((60, 20), pygame.SRCALPHA)
-        mini_screen.fill((0, 0, 0, 100))
-        if self.is_locked and self.cursor_blink:
-            cursor = self.font.render("_", True, NEON_GREEN)
-            mini_screen.blit(cursor, (5, 5))
+        mini_screen = resource_manager.get_sprite("terminal_screen", self.build_mini_screen)
         surface.blit(mini_screen, (self.rect.x + 5, self.rect.y + 10))
-        label = self.font.render(self.name, True, NEON_WHITE)
+        if self.is_locked and self.cursor_blink:
+            cursor = resource_manager.render_label("_", FONT_MEDIUM, FONT_SIZE_SM, NEON_GREEN)
+            surface.blit(cursor, (self.rect.x + 10, self.rect.y + 15))
+        label = resource_manager.render_label(self.name, FONT_MEDIUM, FONT_SIZE_SM, NEON_WHITE)
         surface.blit(label, (self.rect.centerx - label.get_width() // 2, self.rect.top - 20))
 
+    def build_mini_screen(self):
+        mini_screen = pygame.Surface((60, 20), pygame.SRCALPHA)
+        mini_screen.fill((0, 0, 0, 100))
+        return mini_screen
+
+    def get_dirty_rect(self):
+        # Blinking cursor on the mini screen
+        return pygame.Rect(self.rect.x + 5, self.rect.y + 10, 60, 20)
+
     def draw_puzzle(self, surface):
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        surface.blit(overlay, (0, 0))
+        surface.blit(resource_manager.get_overlay("dim", surface.get_size()), (0, 0))
         rect = pygame.Rect(WIDTH // 8, HEIGHT // 8, WIDTH * 6 // 8, HEIGHT * 6 // 8)
         pygame.draw.rect(surface, DARK_GLOW, rect)
         pygame.draw.rect(surface, NEON_CYAN, rect, 3)
-        font = pygame.font.Font(FONT_MEDIUM, FONT_SIZE_MD)
         message_rect = pygame.Rect(rect.x + 20, rect.y + 30, rect.width - 40, rect.height // 2)
         if isinstance(self.current_message, list) and len(self.current_message) > 1:  # Default message
             y = message_rect.y
             line_spacing = 40
             for line in self.current_message:
-                text_surface = font.render(line, True, NEON_WHITE)
+                text_surface = resource_manager.render_text(line, FONT_MEDIUM, FONT_SIZE_MD, NEON_WHITE)
                 x = rect.centerx - text_surface.get_width() // 2
                 surface.blit(text_surface, (x, y))
                 y += line_spacing
         else:  # Temporary or solved message
             message = self.current_message[0] if self.current_message else ""
-            wrap_text(surface, message, font, NEON_WHITE, message_rect)
+            wrap_text(surface, message, FONT_MEDIUM, FONT_SIZE_MD, NEON_WHITE, message_rect)
         if self.is_locked:
             input_rect = pygame.Rect(WIDTH // 4, HEIGHT - 150, WIDTH // 2, 40)
             pygame.draw.rect(surface, NEON_CYAN, input_rect, 2)
-            input_text = font.render(self.input_text + ("_" if self.cursor_blink else ""), True, NEON_WHITE)
+            input_text = resource_manager.render_uncached(self.input_text + ("_" if self.cursor_blink else ""), FONT_MEDIUM, FONT_SIZE_MD, NEON_WHITE)
             surface.blit(input_text, (input_rect.x + 5, input_rect.y + 5))
             if self.show_cheat and self.solution:
                 # disply one time solution
                 print(f"{self.solution}")
-        hint_font = pygame.font.Font(FONT_MEDIUM, FONT_SIZE_SM)
-        hint = hint_font.render("ENTER to submit, ESC to exit", True, NEON_WHITE)
+        hint = resource_manager.render_text("ENTER to submit, ESC to exit", FONT_MEDIUM, FONT_SIZE_SM, NEON_WHITE)
         surface.blit(hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT))
 
     def reset(self):
@@ -292,35 +326,103 @@ class Terminal(pygame.sprite.Sprite):
         self.message_time = 0
         self.generate_puzzle()
 
+class SpatialHash:
+    """Uniform grid of cells mapping to the static objects that overlap them."""
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.order = {}
+
+    def cell_range(self, rect):
+        return (range(rect.left // self.cell_size, (rect.right - 1) // self.cell_size + 1),
+                range(rect.top // self.cell_size, (rect.bottom - 1) // self.cell_size + 1))
+
+    def insert(self, obj):
+        self.order[obj] = len(self.order)
+        columns, rows = self.cell_range(obj.rect)
+        for cx in columns:
+            for cy in rows:
+                self.cells.setdefault((cx, cy), []).append(obj)
+
+    def query(self, rect):
+        """Returns objects colliding with rect, in insertion order."""
+        found = set()
+        columns, rows = self.cell_range(rect)
+        for cx in columns:
+            for cy in rows:
+                for obj in self.cells.get((cx, cy), ()):
+                    if obj not in found and rect.colliderect(obj.rect):
+                        found.add(obj)
+        return sorted(found, key=self.order.get)
+
 class Room:
-    def __init__(self, name, objects):
+    def __init__(self, name, objects, key=None):
         self.name = name
+        self.key = key
         self.objects = pygame.sprite.Group(objects)
+        self.background = None
+        self.background_generation = None  # resource_manager.generation the background was built for
+        # Doors and terminals never move, so the grid is built once
+        self.spatial_hash = SpatialHash()
+        for obj in objects:
+            self.spatial_hash.insert(obj)
+
+    def find_interactable(self, rect):
+        hits = self.spatial_hash.query(rect)
+        return hits[0] if hits else None
+
+    def build_background(self, size):
+        # Static layer: floor panel, grid, border and room title
+        width, height = size
+        background = resource_manager.convert(pygame.Surface(size))
+        background.fill(NEON_BLACK)
+        pygame.draw.rect(background, DARK_GLOW, (50, 50, width - 100, height - 100))
+        for i in range(50, width - 50, 20):
+            pygame.draw.line(background, GRID_GLOW, (i, 50), (i, height - 50), 1)
+        for i in range(50, height - 50, 20):
+            pygame.draw.line(background, GRID_GLOW, (50, i), (width - 50, i), 1)
+        pygame.draw.rect(background, NEON_CYAN, (50, 50, width - 100, height - 100), 5)
+        name_text = resource_manager.render_text(self.name, FONT_BOLD, FONT_SIZE_LG, NEON_WHITE)
+        background.blit(name_text, (width // 2 - name_text.get_width() // 2, 10))
+        self.background = background
+        self.background_generation = resource_manager.generation
+
+    def invalidate_background(self):
+        self.background = None
 
     def draw(self, surface):
-        surface.fill(NEON_BLACK)
-        pygame.draw.rect(surface, DARK_GLOW, (50, 50, WIDTH - 100, HEIGHT - 100))
-        for i in range(50, WIDTH - 50, 20):
-            pygame.draw.line(surface, GRID_GLOW, (i, 50), (i, HEIGHT - 50), 1)
-        for i in range(50, HEIGHT - 50, 20):
-            pygame.draw.line(surface, GRID_GLOW, (50, i), (WIDTH - 50, i), 1)
-        pygame.draw.rect(surface, NEON_CYAN, (50, 50, WIDTH - 100, HEIGHT - 100), 5)
-        font = pygame.font.Font(FONT_BOLD, FONT_SIZE_LG)
-        name_text = font.render(self.name, True, NEON_WHITE)
-        surface.blit(name_text, (WIDTH // 2 - name_text.get_width() // 2, 10))
+        stale = self.background_generation != resource_manager.generation
+        if self.background is None or stale or self.background.get_size() != surface.get_size():
+            self.build_background(surface.get_size())
+        surface.blit(self.background, (0, 0))
         self.objects.draw(surface)
         for obj in self.objects:
             obj.draw(surface)
 
 class GameManager:
-    def __init__(self):
-        pygame.mixer.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    def __init__(self, headless=False, seed=None):
+        # Headless sessions skip the window, audio and drawing (see simulation.py)
+        self.headless = headless
+        # A seed makes the session reproducible for recording and replay (see replay.py)
+        self.seed = seed
+        if seed is not None:
+            random.seed(seed)
+        if headless:
+            self.screen = None
+        else:
+            pygame.mixer.init()
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         self.clock = pygame.time.Clock()
         self.game_state = STATE_MENU
         self.player = Player(WIDTH // 2, HEIGHT // 2)
-        self.puzzle_generator = PuzzleGenerator()
+        puzzle_index = PuzzleIndex(PUZZLE_INDEX_PATH) if os.path.exists(PUZZLE_INDEX_PATH) else None
+        self.puzzle_generator = PuzzleGenerator(RSA_KEY_TIERS, puzzle_index, PRIME_TIERS)
+        # No refill thread for seeded sessions, so puzzles come out in a fixed order
+        self.puzzle_pool = PuzzlePool(self.puzzle_generator, PUZZLE_POOL_SIZE, PUZZLE_POOL_DIFFICULTIES, background=seed is None)
+        self.level = LevelData.load(LEVEL_PATH)
         self.rooms = {}
+        self.room_lock = threading.Lock()  # The preloader builds rooms from a worker thread
+        self.room_cache = OrderedDict()  # Rooms holding cached backgrounds, least recently entered first
         self.current_room = None
         self.current_puzzle = None
         self.ui_manager = UIManager(self)
@@ -329,25 +431,34 @@ class GameManager:
         self.alarm_on = True
         self.alarm_visible = False
         self.last_alarm_flash = 0
+        self.renderer = DirtyRectRenderer()
+        self.last_frame_key = None
+        self.tooltip_target = None
+        self.preloader = None
         self.setup_game()
+        self.ui_manager.play_menu_music()
+        if not headless:
+            # The menu draws while the rest loads; seeded sessions load inline so room puzzles come out in a fixed order
+            self.preloader = Preloader(self.preload_tasks())
+            self.preloader.start(background=seed is None)
+
+    def set_display_mode(self, flags=0):
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
+        # Everything converted for the previous display format is converted again or rebuilt on demand;
+        # room backgrounds and the HUD notice the new resource_manager.generation themselves
+        resource_manager.display_changed()
+        self.cutscene_manager.typewriter = None
+        self.player.image = resource_manager.convert(self.player.image)
+        with self.room_lock:
+            rooms = list(self.rooms.values())
+        for room in rooms:
+            for obj in room.objects:
+                obj.image = resource_manager.convert(obj.image)
+        self.renderer.force_full_redraw()
 
     def setup_game(self):
-        door_control_to_lab = Door(WIDTH - 80, HEIGHT // 2 - 50, 30, 100, "lab_room", 80, HEIGHT // 2)
-        door_lab_to_control = Door(50, HEIGHT // 2 - 50, 30, 100, "control_room", WIDTH - 130, HEIGHT // 2)
-        door_lab_to_distress = Door(WIDTH - 80, HEIGHT // 2 - 50, 30, 100, "distress_room", 80, HEIGHT // 2)
-        door_distress_to_lab = Door(50, HEIGHT // 2 - 50, 30, 100, "lab_room", WIDTH - 130, HEIGHT // 2)
-        terminal_control = Terminal(200, 300, self.puzzle_generator, door_control_to_lab)
-        terminal_lab = Terminal(WIDTH - 300, 300, self.puzzle_generator, door_lab_to_distress)
-        terminal_distress = Terminal(WIDTH // 2 - 35, HEIGHT // 2 - 50, self.puzzle_generator, is_final=True)
-        self.all_doors = [door_control_to_lab, door_lab_to_control, door_lab_to_distress, door_distress_to_lab]
-        self.all_terminals = [terminal_control, terminal_lab, terminal_distress]
-        self.rooms = {
-            "control_room": Room("Control Room", [terminal_control, door_control_to_lab]),
-            "lab_room": Room("Research Lab", [door_lab_to_control, terminal_lab, door_lab_to_distress]),
-            "distress_room": Room("Distress Signal Room", [door_distress_to_lab, terminal_distress]),
-            "win_room": Room("Win Screen", [])
-        }
-        self.current_room = self.rooms["control_room"]
+        self.player.teleport(*self.level.spawn)
+        self.set_current_room(self.level.start_room, announce=False)
         self.start_button = Button(WIDTH // 2 - 100, HEIGHT // 2 - 60, 200, 50, "Start Mission", self.start_intro_cutscene)
         self.how_to_play_button = Button(WIDTH // 2 - 100, HEIGHT // 2 + 10, 200, 50, "How to Play", self.show_how_to_play)
         self.exit_button = Button(WIDTH // 2 - 100, HEIGHT // 2 + 80, 200, 50, "Exit", self.exit_game)
@@ -356,17 +467,58 @@ class GameManager:
 
     def set_game_state(self, state):
         self.game_state = state
-        if state != STATE_MENU and state != STATE_HOW_TO_PLAY and state != STATE_GAME_OVER and state != STATE_WIN_SCREEN:
-            self.ui_manager.stop_music()
-            if state == STATE_GAMEPLAY:
-                self.ui_manager.play_gameplay_ambience()
-        else:
-            self.ui_manager.stop_gameplay_ambience()
+        # Requests for the track already playing are ignored, so moving in and out of a puzzle doesn't reload it
+        if state in [STATE_MENU, STATE_HOW_TO_PLAY]:
             self.ui_manager.play_menu_music()
+        elif state in [STATE_GAMEPLAY, STATE_PUZZLE_RSA]:
+            self.ui_manager.play_gameplay_ambience()
+        else:
+            self.ui_manager.stop_music()
 
-    def set_current_room(self, room_key):
-        self.current_room = self.rooms[room_key]
-        self.ui_manager.set_message(f"Entering: {self.current_room.name}", NEON_CYAN)
+    def get_room(self, room_key):
+        # Rooms are built from the level file the first time they are entered
+        with self.room_lock:
+            room = self.rooms.get(room_key)
+            if room is None:
+                spec = self.level.room_spec(room_key)
+                doors = {}
+                for door_spec in spec.get("doors", []):
+                    x, y, width, height = door_spec["rect"]
+                    target_x, target_y = door_spec["target_pos"]
+                    door = Door(x, y, width, height, door_spec["target"], target_x, target_y)
+                    if not door_spec.get("locked", True):
+                        door.is_locked = False
+                        door.update_color()
+                    doors[door_spec["id"]] = door
+                terminals = []
+                for terminal_spec in spec.get("terminals", []):
+                    x, y = terminal_spec["pos"]
+                    unlocks = doors.get(terminal_spec.get("unlocks"))
+                    terminals.append(Terminal(x, y, self.puzzle_pool, unlocks, terminal_spec.get("final", False)))
+                room = Room(spec["name"], terminals + list(doors.values()), room_key)
+                self.rooms[room_key] = room
+        return room
+
+    def preload_tasks(self):
+        """Startup loading done after the first menu frame, roughly in the order it is needed."""
+        tasks = [("fonts", lambda font_file=font_file, size=size: resource_manager.get_font(font_file, size)) for font_file, size in PRELOAD_FONTS]
+        tasks += [("music", lambda track=track: self.ui_manager.music.load(track)) for track in MUSIC_TRACKS]
+        tasks += [("sounds", lambda sound_file=sound_file: self.ui_manager.sound_bank.load(sound_file)) for sound_file in SOUND_EFFECTS]
+        tasks += [("overlays", lambda kind=kind: resource_manager.get_overlay(kind, (WIDTH, HEIGHT))) for kind in ["dim", "alarm", "vignette"]]
+        # Only the spawn room: building a room creates its terminals, which take puzzles from the pool
+        tasks.append(("rooms", lambda: self.get_room(self.level.start_room).build_background((WIDTH, HEIGHT))))
+        return tasks
+
+    def set_current_room(self, room_key, announce=True):
+        self.current_room = self.get_room(room_key)
+        # Keep cached backgrounds only for the most recently entered rooms
+        self.room_cache[room_key] = self.current_room
+        self.room_cache.move_to_end(room_key)
+        while len(self.room_cache) > ROOM_CACHE_SIZE:
+            _, evicted = self.room_cache.popitem(last=False)
+            evicted.invalidate_background()
+        if announce:
+            self.ui_manager.set_message(f"Entering: {self.current_room.name}", NEON_CYAN)
 
     def set_current_puzzle(self, puzzle):
         self.current_puzzle = puzzle
@@ -377,7 +529,7 @@ class GameManager:
 
     def start_gameplay(self):
         self.set_game_state(STATE_GAMEPLAY)
-        self.player.last_oxygen_tick = pygame.time.get_ticks()
+        self.player.last_oxygen_tick = game_clock.now()
         self.ui_manager.set_message("Mission started! Press 'E' to interact", NEON_CYAN)
 
     def show_how_to_play(self):
@@ -386,8 +538,8 @@ class GameManager:
     def exit_game(self):
         self.running = False
         self.ui_manager.stop_music()
-        self.ui_manager.stop_gameplay_ambience()
         self.ui_manager.stop_low_oxygen_alert()
+        self.puzzle_pool.stop()
 
     def start_final_cutscene(self):
         self.set_game_state(STATE_CUTSCENE_OUTRO)
@@ -401,12 +553,14 @@ class GameManager:
 
     def reset_game(self):
         self.player.reset()
-        for door in self.all_doors:
-            door.reset()
-        for terminal in self.all_terminals:
-            terminal.reset()
-        self.current_room = self.rooms["control_room"]
+        self.player.teleport(*self.level.spawn)
+        # Dropping the rooms resets every door and terminal; they are rebuilt on entry
+        with self.room_lock:
+            self.rooms = {}
+        self.room_cache.clear()
+        self.set_current_room(self.level.start_room, announce=False)
         self.current_puzzle = None
+        self.tooltip_target = None
         self.alarm_on = True
         self.alarm_visible = False
         self.last_alarm_flash = 0
@@ -414,11 +568,20 @@ class GameManager:
         self.ui_manager.stop_low_oxygen_alert()
         self.set_game_state(STATE_MENU)
 
-    def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+    def handle_events(self, events=None):
+        for event in events if events is not None else pygame.event.get():
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.toggle_overlay()
+                self.renderer.force_full_redraw()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                try:
+                    self.ui_manager.set_message(f"Frame timings written to {profiler.dump_snapshot()}", NEON_CYAN)
+                except OSError as error:
+                    self.ui_manager.set_message(f"Could not write frame timings: {error.strerror}", NEON_RED)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+                self.set_display_mode(self.screen.get_flags() ^ pygame.FULLSCREEN)
+            elif event.type == pygame.QUIT:
                 self.ui_manager.stop_music()
-                self.ui_manager.stop_gameplay_ambience()
                 self.ui_manager.stop_low_oxygen_alert()
                 self.running = False
             elif self.game_state == STATE_MENU:
@@ -433,28 +596,9 @@ class GameManager:
                 self.cutscene_manager.handle_event(event)
             elif self.game_state == STATE_GAMEPLAY:
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_e:
-                    interacted = False
-                    for obj in self.current_room.objects:
-                        if self.player.rect.colliderect(obj.rect):
-                            if isinstance(obj, Door):
-                                obj.interact(self.player, self)
-                            else:
-                                obj.interact(self)
-                            interacted = True
-                            break
-                    if not interacted:
-                        self.set_game_message("Nothing to interact here.", NEON_YELLOW)
+                    self.interact()
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     self.show_how_to_play()
-                tooltip_set = False
-                for obj in self.current_room.objects:
-                    if self.player.rect.colliderect(obj.rect):
-                        action = "Unlock Door" if isinstance(obj, Door) else "Access Terminal"
-                        self.ui_manager.set_tooltip(f"Interact [E]: {action}")
-                        tooltip_set = True
-                        break
-                if not tooltip_set:
-                    self.ui_manager.set_tooltip("")
             elif self.game_state == STATE_PUZZLE_RSA:
                 if self.current_puzzle:
                     self.current_puzzle.handle_input(event, self)
@@ -469,31 +613,63 @@ class GameManager:
                 self.restart_button.handle_event(event)
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     self.ui_manager.stop_music()
-                    self.ui_manager.stop_gameplay_ambience()
                     self.ui_manager.stop_low_oxygen_alert()
                     self.running = False
 
-    def update(self):
+    def interact(self):
+        obj = self.current_room.find_interactable(self.player.rect)
+        if isinstance(obj, Door):
+            obj.interact(self.player, self)
+        elif obj:
+            obj.interact(self)
+        else:
+            self.set_game_message("Nothing to interact here.", NEON_YELLOW)
+
+    def update(self, keys=None):
         self.ui_manager.update()
         if self.game_state == STATE_GAMEPLAY:
-            self.player.update(pygame.key.get_pressed())
+            self.player.update(keys if keys is not None else pygame.key.get_pressed())
             if not self.player.is_alive:
                 self.ui_manager.play_sound(PLAYER_DEATH, 0.6)
                 self.set_game_state(STATE_GAME_OVER)
             if self.alarm_on:
-                current_time = pygame.time.get_ticks()
+                current_time = game_clock.now()
                 if current_time - self.last_alarm_flash >= ALARM_FLASH_INTERVAL:
                     self.alarm_visible = not self.alarm_visible
                     self.last_alarm_flash = current_time
             for obj in self.current_room.objects:
                 obj.update()
+            self.update_tooltip()
         elif self.game_state in [STATE_CUTSCENE_INTRO, STATE_CUTSCENE_OUTRO]:
             self.cutscene_manager.update()
         elif self.game_state == STATE_PUZZLE_RSA:
             if self.current_puzzle:
                 self.current_puzzle.update()
 
+    def update_tooltip(self):
+        # Resolved once per frame; only touches the UI when the object under the player changes,
+        # or when the player is still on it after its tooltip has faded out
+        obj = self.current_room.find_interactable(self.player.rect)
+        if obj is self.tooltip_target and (obj is None or self.ui_manager.tooltip):
+            return
+        self.tooltip_target = obj
+        if obj:
+            action = "Unlock Door" if isinstance(obj, Door) else "Access Terminal"
+            self.ui_manager.set_tooltip(f"Interact [E]: {action}")
+        else:
+            self.ui_manager.set_tooltip("")
+
     def draw(self):
+        with profiler.span("draw"):
+            self.render()
+        # Drawn outside the span so the overlay doesn't show up in its own numbers
+        profiler.draw(self.screen)
+        with profiler.span("present"):
+            self.mark_dirty_rects()
+            self.renderer.present()
+
+    def render(self):
+        resource_manager.sync_display()
         self.screen.fill(NEON_BLACK)
         if self.game_state == STATE_MENU:
             self.ui_manager.draw_menu([self.start_button, self.how_to_play_button, self.exit_button])
@@ -502,21 +678,69 @@ class GameManager:
         elif self.game_state in [STATE_CUTSCENE_INTRO, STATE_CUTSCENE_OUTRO]:
             self.cutscene_manager.draw(self.screen)
         elif self.game_state == STATE_GAMEPLAY:
-            self.current_room.draw(self.screen)
-            self.player.draw(self.screen)
-            self.ui_manager.draw_gameplay(self.screen)
+            with profiler.span("room"):
+                self.current_room.draw(self.screen)
+                self.player.draw(self.screen, game_clock.alpha)
+            with profiler.span("hud"):
+                self.ui_manager.draw_gameplay(self.screen)
         elif self.game_state == STATE_PUZZLE_RSA:
             if self.current_puzzle:
-                self.current_puzzle.draw_puzzle(self.screen)
+                with profiler.span("puzzle"):
+                    self.current_puzzle.draw_puzzle(self.screen)
         elif self.game_state == STATE_GAME_OVER:
             self.ui_manager.draw_game_over(self.restart_button)
         elif self.game_state == STATE_WIN_SCREEN:
             self.ui_manager.draw_win_screen(self.restart_button)
-        pygame.display.flip()
 
-    def run(self):
+    def mark_dirty_rects(self):
+        # Anything that changes the whole screen forces a full flip
+        frame_key = (self.game_state, self.current_room, self.alarm_on and self.alarm_visible, self.player.oxygen <= VIGNETTE_THRESHOLD)
+        if frame_key != self.last_frame_key or self.game_state not in [STATE_GAMEPLAY, STATE_PUZZLE_RSA]:
+            self.renderer.force_full_redraw()
+        self.last_frame_key = frame_key
+        if self.game_state == STATE_GAMEPLAY:
+            self.renderer.mark(self.player.get_dirty_rect())
+            for obj in self.current_room.objects:
+                self.renderer.mark(obj.get_dirty_rect())
+            self.renderer.mark_all(self.ui_manager.get_dirty_rects())
+        elif self.game_state == STATE_PUZZLE_RSA:
+            self.renderer.mark((WIDTH // 8, HEIGHT // 8, WIDTH * 6 // 8, HEIGHT * 6 // 8))
+        if profiler.show_overlay:
+            self.renderer.mark(profiler.overlay_rect)
+
+    def advance(self, keys=None):
+        """Runs one headless simulation step: no events, drawing or frame cap."""
+        game_clock.advance(game_clock.step_ms)
+        while game_clock.step():
+            self.update(keys)
+
+    def run(self, recorder=None, replay=None, uncapped=False):
         while self.running:
-            self.handle_events()
-            self.update()
+            profiler.begin_frame()
+            with profiler.span("events"):
+                if replay:
+                    frame = replay.next_frame()
+                    if frame is None:
+                        break
+                    dt, keys, events = frame
+                    game_clock.advance(dt)
+                    # The live queue is still drained so the window stays responsive; only closing it gets through
+                    events += [event for event in pygame.event.get() if event.type == pygame.QUIT]
+                else:
+                    game_clock.begin_frame()
+                    events = pygame.event.get()
+                    keys = pygame.key.get_pressed()
+                if recorder:
+                    recorder.record_frame(game_clock.dt, keys, events)
+                self.handle_events(events)
+            # Simulation runs in fixed steps regardless of the render rate
+            with profiler.span("update"):
+                while game_clock.step():
+                    self.update(keys)
             self.draw()
-            self.clock.tick(FPS)
\ No newline at end of file
+            profiler.end_frame()
+            if replay and not uncapped:
+                # Pace the replay like the recorded frame
+                self.clock.tick(1000 / dt if dt else 0)
+            elif not replay:
+                self.clock.tick(FPS)
\ No newline at end of file
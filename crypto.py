@@ -1,51 +1,195 @@
 import random
 import math
+import threading
+import time
+from array import array
+from collections import deque
+from functools import lru_cache
 
 def extended_gcd(a, b):
     """Returns gcd and Bezout coefficients for ax + by = gcd(a, b)."""
-    if a == 0:
-        return b, 0, 1
-    gcd, x1, y1 = extended_gcd(b % a, a)
-    x = y1 - (b // a) * x1
-    y = x1
-    return gcd, x, y
+    x0, y0, x1, y1 = 0, 1, 1, 0
+    while a != 0:
+        quotient = b // a
+        a, b = b % a, a
+        x0, x1 = x1, x0 - quotient * x1
+        y0, y1 = y1, y0 - quotient * y1
+    return b, x0, y0
 
 def mod_inverse(e, phi):
     """Returns modular inverse of e modulo phi."""
-    gcd, x, _ = extended_gcd(e, phi)
-    if gcd != 1:
-        raise ValueError("Modular inverse does not exist")
-    return (x % phi + phi) % phi
+    try:
+        return pow(e, -1, phi)
+    except ValueError:
+        raise ValueError("Modular inverse does not exist") from None
+
+def batch_mod_inverse(values, modulus):
+    """Returns the inverses of all values modulo modulus using Montgomery's trick:
+    one modular inversion plus about 3(k-1) multiplications for k values."""
+    if not values:
+        return []
+    prefix = [0] * len(values)
+    acc = 1
+    for i, value in enumerate(values):
+        prefix[i] = acc
+        acc = acc * value % modulus
+    inverse = mod_inverse(acc, modulus)
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        inverses[i] = inverse * prefix[i] % modulus
+        inverse = inverse * values[i] % modulus
+    return inverses
 
 def decrypt(ciphertext, d, n):
     """Decrypts RSA ciphertext using private key (d, n)."""
     return pow(ciphertext, d, n)
 
+def crt_params(p, q, d):
+    """Returns the CRT private-key values (dp, dq, qinv)."""
+    return d % (p - 1), d % (q - 1), mod_inverse(q, p)
+
+def decrypt_crt(ciphertext, p, q, dp, dq, qinv):
+    """Decrypts RSA ciphertext with two half-size exponentiations (Garner's formula)."""
+    m1 = pow(ciphertext, dp, p)
+    m2 = pow(ciphertext, dq, q)
+    h = (qinv * (m1 - m2)) % p
+    return m2 + h * q
+
+@lru_cache(maxsize=1024)
+def crt_key(p, q, e):
+    """Returns (dp, dq, qinv) for the puzzle key (p, q, e), computed once per key."""
+    return crt_params(p, q, mod_inverse(e, (p - 1) * (q - 1)))
+
 def solve(p, q, e, c):
     """Solves RSA puzzle to find plaintext M."""
-    n = p * q
-    phi = (p - 1) * (q - 1)
-    d = mod_inverse(e, phi)
-    return str(decrypt(c, d, n))
+    return str(decrypt_crt(c, p, q, *crt_key(p, q, e)))
+
+def sieve_primes(limit):
+    """Returns all primes below limit (sieve of Eratosthenes)."""
+    is_prime = bytearray([1]) * limit
+    is_prime[:2] = b"\x00\x00"
+    for i in range(2, int(limit ** 0.5) + 1):
+        if is_prime[i]:
+            is_prime[i * i::i] = bytearray(len(range(i * i, limit, i)))
+    return array('I', (i for i in range(limit) if is_prime[i]))
+
+SMALL_PRIMES = sieve_primes(2000)
+
+def is_probable_prime(n, rounds=40):
+    """Miller-Rabin primality test with a small-prime trial division pre-filter."""
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for _ in range(rounds):
+        x = pow(random.randrange(2, n - 1), d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def generate_prime(bits):
+    """Returns a random prime with exactly `bits` bits and the top two bits set."""
+    while True:
+        candidate = random.getrandbits(bits) | (3 << (bits - 2)) | 1
+        if is_probable_prime(candidate):
+            return candidate
+
+def random_coprime(phi):
+    """Picks e uniformly from [2, phi) with gcd(e, phi) == 1 by rejection sampling."""
+    while True:
+        e = random.randrange(2, phi)
+        if math.gcd(e, phi) == 1:
+            return e
+
+class PrimeTable:
+    """Sieved primes in a compact array, bucketed by bit length."""
+    def __init__(self, limit):
+        self.limit = limit
+        self.primes = sieve_primes(limit)
+        # Primes are sorted, so each bit length is a contiguous index range
+        self.buckets = {}
+        for i, prime in enumerate(self.primes):
+            start, _ = self.buckets.get(prime.bit_length(), (i, i))
+            self.buckets[prime.bit_length()] = (start, i + 1)
+
+    def tier_range(self, min_bits, max_bits):
+        """Returns the (start, end) index range holding primes of min_bits..max_bits bits."""
+        ranges = [self.buckets[bits] for bits in range(min_bits, max_bits + 1) if bits in self.buckets]
+        if not ranges:
+            raise ValueError(f"No primes with {min_bits}-{max_bits} bits below {self.limit}")
+        return ranges[0][0], ranges[-1][1]
+
+    def sample_index(self, start, end, exclude=None):
+        """Returns a random index in [start, end) in O(1), skipping the index `exclude` if it is in range."""
+        if exclude is None or not start <= exclude < end:
+            return random.randrange(start, end)
+        i = random.randrange(start, end - 1)
+        return i + 1 if i >= exclude else i
+
+    def sample_pair(self, start, end):
+        """Returns two distinct primes from [start, end) in O(1) without copying."""
+        i = self.sample_index(start, end)
+        j = self.sample_index(start, end, exclude=i)
+        return self.primes[i], self.primes[j]
+
+@lru_cache(maxsize=None)
+def get_prime_table(limit):
+    """Sieves once per process and limit."""
+    return PrimeTable(limit)
+
+DEFAULT_PRIME_TIERS = {"normal": (4, 7)}
 
 class PuzzleGenerator:
-    def __init__(self):
-        self.primes = [11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
+    def __init__(self, key_tiers=None, index=None, prime_tiers=None):
+        # difficulty -> (min bits, max bits) of the primes drawn from the sieved table
+        self.prime_tiers = prime_tiers or DEFAULT_PRIME_TIERS
+        self.prime_table = get_prime_table(1 << max(max_bits for _, max_bits in self.prime_tiers.values()))
+        self.tier_ranges = {difficulty: self.prime_table.tier_range(*bits) for difficulty, bits in self.prime_tiers.items()}
+        # difficulty -> modulus size in bits for the large-key tiers
+        self.key_tiers = key_tiers or {}
+        # Optional puzzle_index.PuzzleIndex; difficulties it covers are sampled from it
+        self.index = index
 
-    def get_random_prime(self, exclude=None):
-        primes = [p for p in self.primes if p != exclude] if exclude else self.primes
-        return random.choice(primes)
+    @property
+    def difficulties(self):
+        return list(self.prime_tiers) + list(self.key_tiers)
 
-    def generate_puzzle(self):
+    def get_tier_primes(self, difficulty="normal"):
+        start, end = self.tier_ranges[difficulty]
+        return self.prime_table.primes[start:end]
+
+    def get_random_prime_index(self, exclude_index=None, difficulty="normal"):
+        return self.prime_table.sample_index(*self.tier_ranges[difficulty], exclude=exclude_index)
+
+    def get_random_prime(self, exclude_index=None, difficulty="normal"):
+        """Returns a random prime of the tier. Pass the table index from get_random_prime_index
+        to exclude a prime: skipping it is an O(1) index adjustment, no search."""
+        return self.prime_table.primes[self.get_random_prime_index(exclude_index, difficulty)]
+
+    def generate_puzzle(self, difficulty="normal"):
+        if self.index is not None and difficulty in self.index:
+            return self.index.sample(difficulty)
+        if difficulty in self.key_tiers:
+            return self.generate_large_puzzle(self.key_tiers[difficulty])
+        if difficulty not in self.tier_ranges:
+            raise ValueError(f"Unknown puzzle difficulty: {difficulty}")
         while True:
-            p = self.get_random_prime()
-            q = self.get_random_prime(exclude=p)
+            p, q = self.prime_table.sample_pair(*self.tier_ranges[difficulty])
             n = p * q
             phi = (p - 1) * (q - 1)
-            e_candidates = [i for i in range(2, phi) if math.gcd(i, phi) == 1]
-            if not e_candidates:
-                continue
-            e = random.choice(e_candidates)
+            e = random_coprime(phi)
             try:
                 mod_inverse(e, phi)
                 m = random.randint(10, n // 2)
@@ -53,7 +197,93 @@ class PuzzleGenerator:
                 return {'p': p, 'q': q, 'e': e, 'C': c, 'M_solution': str(m)}
             except ValueError:
                 continue
-            
+
+    def generate_large_puzzle(self, bits):
+        """Builds a puzzle with a `bits`-bit modulus from Miller-Rabin primes."""
+        p = generate_prime(bits // 2)
+        q = generate_prime(bits - bits // 2)
+        while q == p:
+            q = generate_prime(bits - bits // 2)
+        n = p * q
+        phi = (p - 1) * (q - 1)
+        e = random_coprime(phi)
+        m = random.randint(10, n // 2)
+        c = pow(m, e, n)
+        return {'p': p, 'q': q, 'e': e, 'C': c, 'M_solution': str(m)}
+
+class PuzzlePool:
+    """Keeps ready puzzles per difficulty, refilled by a background thread."""
+    def __init__(self, generator, size=8, difficulties=("normal",), background=True):
+        self.generator = generator
+        self.size = size
+        self.pools = {difficulty: deque() for difficulty in difficulties}
+        self.condition = threading.Condition()
+        self.refill_latencies = deque(maxlen=100)
+        self.hits = 0
+        self.misses = 0
+        self.running = True
+        self.thread = None
+        if background:
+            self.thread = threading.Thread(target=self.refill_loop, daemon=True)
+            self.thread.start()
+        else:
+            self.fill()
+
+    def generate_puzzle(self, difficulty="normal"):
+        """Returns a pooled puzzle in O(1), generating inline only if the pool is empty."""
+        with self.condition:
+            pool = self.pools.get(difficulty)
+            if pool:
+                self.hits += 1
+                puzzle = pool.popleft()
+                self.condition.notify()
+                return puzzle
+            self.misses += 1
+            self.condition.notify()
+        return self.generator.generate_puzzle(difficulty)
+
+    def needs_refill(self):
+        return any(len(pool) < self.size for pool in self.pools.values())
+
+    def refill_one(self):
+        with self.condition:
+            difficulty = min(self.pools, key=lambda d: len(self.pools[d]))
+        start = time.perf_counter()
+        puzzle = self.generator.generate_puzzle(difficulty)
+        latency = time.perf_counter() - start
+        with self.condition:
+            self.pools[difficulty].append(puzzle)
+            self.refill_latencies.append(latency)
+
+    def fill(self):
+        while self.needs_refill():
+            self.refill_one()
+
+    def refill_loop(self):
+        while True:
+            with self.condition:
+                while self.running and not self.needs_refill():
+                    self.condition.wait()
+                if not self.running:
+                    return
+            self.refill_one()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+
+    def metrics(self):
+        with self.condition:
+            latencies = list(self.refill_latencies)
+            return {
+                'depth': {difficulty: len(pool) for difficulty, pool in self.pools.items()},
+                'hits': self.hits,
+                'misses': self.misses,
+                'refill_latency_ms': 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+                'refill_latency_max_ms': 1000 * max(latencies) if latencies else 0.0
+            }
+
     
 # def solve(p, q, e, c):
 #     """find plaintext M."""
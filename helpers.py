@@ -1,22 +1,85 @@
 import pygame
+from functools import lru_cache
+from config import LAYOUT_CACHE_SIZE
+from resources import resource_manager
 
-def wrap_text(surface, text, font, color, rect):
+LINE_GAP = 5  # Extra pixels between wrapped lines
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def layout_lines(text, font_file, size, width):
+    """Splits text into lines no wider than `width`, measuring each word once with font.size."""
+    font = resource_manager.get_font(font_file, size)
+    with resource_manager.lock:
+        space = font.size(' ')[0]
+        lines = []
+        current_line = []
+        line_width = 0
+        for word in text.split(' '):
+            word_width = font.size(word)[0]
+            if current_line and line_width + space + word_width > width:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+                line_width = word_width
+            else:
+                line_width += (space if current_line else 0) + word_width
+                current_line.append(word)
+        lines.append(' '.join(current_line))
+    return tuple(lines)
+
+def wrap_text(surface, text, font_file, size, color, rect):
     """Wraps text within a rectangle, returns final y-coordinate."""
-    words = text.split(' ')
-    lines = []
-    current_line = []
-    for word in words:
-        test_line = ' '.join(current_line + [word])
-        test_surface = font.render(test_line, True, color)
-        if test_surface.get_width() <= rect.width:
-            current_line.append(word)
-        else:
-            lines.append(' '.join(current_line))
-            current_line = [word]
-    lines.append(' '.join(current_line))
+    font = resource_manager.get_font(font_file, size)
     y = rect.y
-    for line in lines:
-        text_surface = font.render(line, True, color)
+    for line in layout_lines(text, font_file, size, rect.width):
+        text_surface = resource_manager.render_text(line, font_file, size, color)
         surface.blit(text_surface, (rect.x + (rect.width - text_surface.get_width()) // 2, y))
-        y += font.get_height() + 5
-    return y
\ No newline at end of file
+        y += font.get_height() + LINE_GAP
+    return y
+
+class TypewriterText:
+    """Wrapped text revealed a character at a time. Lines are laid out once
+    for the full text, and each revealed glyph is rendered once onto its
+    line's persistent surface, so a frame only blits the visible lines."""
+    def __init__(self, text, font_file, size, color, width):
+        self.text = text
+        self.font = resource_manager.get_font(font_file, size)
+        self.color = color
+        self.lines = layout_lines(text, font_file, size, width)
+        self.surfaces = []
+        self.widths = []  # Revealed width of each started line
+        self.line = 0
+        self.column = 0
+        self.shown = 0
+
+    def show(self, count):
+        """Reveals characters up to `count` of the full text."""
+        count = min(count, len(self.text))
+        # Glyphs are rendered and measured straight from the font, so hold the manager's lock
+        with resource_manager.lock:
+            while self.shown < count:
+                if self.line >= len(self.lines):
+                    break
+                line = self.lines[self.line]
+                if self.column == len(line):
+                    # The space that ended this line isn't drawn
+                    self.line += 1
+                    self.column = 0
+                    self.shown += 1
+                    continue
+                if self.column == 0:
+                    self.surfaces.append(resource_manager.convert(pygame.Surface(self.font.size(line), pygame.SRCALPHA), alpha=True))
+                    self.widths.append(0)
+                glyph = self.font.render(line[self.column], True, self.color)
+                self.surfaces[-1].blit(glyph, (self.widths[-1], 0))
+                self.column += 1
+                # Measured on the prefix so kerning matches a whole-line render
+                self.widths[-1] = self.font.size(line[:self.column])[0]
+                self.shown += 1
+
+    def draw(self, surface, rect):
+        """Draws the revealed lines centred in `rect`, returns final y-coordinate."""
+        y = rect.y
+        for line_surface, width in zip(self.surfaces, self.widths):
+            surface.blit(line_surface, (rect.x + (rect.width - width) // 2, y), (0, 0, width, line_surface.get_height()))
+            y += self.font.get_height() + LINE_GAP
+        return y
@@ -0,0 +1,32 @@
+import json
+
+class LevelData:
+    """Station layout loaded from a level file: rooms, doors, terminals, spawn and map."""
+    def __init__(self, data):
+        self.name = data.get("name", "")
+        self.rooms = data["rooms"]
+        self.start_room = data["start_room"]
+        self.spawn = tuple(data["spawn"])
+        if self.start_room not in self.rooms:
+            raise ValueError(f"Unknown start room: {self.start_room}")
+        for key, room in self.rooms.items():
+            door_ids = {door["id"] for door in room.get("doors", [])}
+            for door in room.get("doors", []):
+                if door["target"] not in self.rooms and door["target"] != "win_room":
+                    raise ValueError(f"Door {door['id']} in {key} leads to unknown room {door['target']}")
+            for terminal in room.get("terminals", []):
+                # Terminals can only unlock doors in their own room
+                if terminal.get("unlocks") and terminal["unlocks"] not in door_ids:
+                    raise ValueError(f"Terminal in {key} unlocks unknown door {terminal['unlocks']}")
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as stream:
+            return cls(json.load(stream))
+
+    def room_spec(self, key):
+        return self.rooms[key]
+
+    def map_positions(self):
+        """Returns {room key: (x, y)} in minimap units, -1..1 from the radar center."""
+        return {key: tuple(room.get("map", (0, 0))) for key, room in self.rooms.items()}
@@ -1,15 +1,54 @@
+import time
+STARTUP_TIME = time.perf_counter()  # Reference point for --time-to-first-frame
 import pygame
 import sys
+import argparse
+import json
+import random
 from core import GameManager
+from replay import InputRecorder, ReplayLog
+from timing import game_clock
 
 def main():
-    # Initialize Pygame and set up the game window
-    pygame.init()
+    parser = argparse.ArgumentParser(description="Mission CryptoSpace (Crypternity)")
+    parser.add_argument("--record", metavar="PATH", help="record input and RNG seed to a replay log")
+    parser.add_argument("--replay", metavar="PATH", help="play back a replay log")
+    parser.add_argument("--uncapped", action="store_true", help="replay as fast as possible")
+    parser.add_argument("--time-to-first-frame", action="store_true", help="draw the first frame, print startup timings as JSON and exit")
+    args = parser.parse_args()
+    # Initialize only the subsystems the game uses; GameManager opens the mixer
+    pygame.display.init()
+    pygame.font.init()
     pygame.display.set_caption("Mission CryptoSpace (Crypternity)")
-    game = GameManager() 
-    game.run()
+    recorder = replay = None
+    seed = None
+    if args.replay:
+        replay = ReplayLog(args.replay)
+        seed = replay.seed
+    elif args.record:
+        seed = random.randrange(2 ** 63)
+        recorder = InputRecorder(args.record, seed, game_clock.step_ms)
+    game = GameManager(seed=seed)
+    if args.time_to_first_frame:
+        game.draw()
+        first_frame = time.perf_counter()
+        game.preloader.wait()
+        print(json.dumps({
+            'first_frame_ms': (first_frame - STARTUP_TIME) * 1000,
+            'assets_ready_ms': (time.perf_counter() - STARTUP_TIME) * 1000
+        }))
+        game.exit_game()
+        pygame.quit()
+        return
+    start = time.perf_counter()
+    game.run(recorder, replay, args.uncapped)
+    if recorder:
+        recorder.close()
+    if replay:
+        elapsed = time.perf_counter() - start
+        print(f"Replayed {replay.frames} frames in {elapsed:.2f}s ({1000 * elapsed / max(replay.frames, 1):.3f} ms/frame)")
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,43 @@
+import threading
+
+class Preloader:
+    """Runs startup loading tasks in order, on a worker thread or inline,
+    and exposes progress for the loading indicator."""
+    def __init__(self, tasks):
+        self.tasks = tasks  # (label, callable) pairs
+        self.completed = 0
+        self.current = ""
+        self.error = None
+        self.finished = threading.Event()
+        self.thread = None
+
+    def start(self, background=True):
+        if background:
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+        else:
+            self.run()
+
+    def run(self):
+        try:
+            for label, task in self.tasks:
+                self.current = label
+                task()
+                self.completed += 1
+        except Exception as error:
+            # Whatever didn't load is loaded on first use instead
+            self.error = error
+        finally:
+            self.current = ""
+            self.finished.set()
+
+    @property
+    def done(self):
+        return self.finished.is_set()
+
+    @property
+    def progress(self):
+        return self.completed / len(self.tasks) if self.tasks else 1.0
+
+    def wait(self, timeout=None):
+        return self.finished.wait(timeout)
@@ -0,0 +1,133 @@
+"""Per-phase frame profiler.
+
+Each frame's events, update, draw and present phases, plus a few draw
+sub-spans, are timed into a fixed-size ring buffer. The overlay (F3)
+shows a stacked frame-time graph with p50/p95/p99 per phase; F4 dumps
+the buffer to PROFILE_DUMP_DIR as CSV or JSON.
+"""
+import csv
+import json
+import os
+import time
+from contextlib import contextmanager
+import numpy as np
+import pygame
+from config import *
+from resources import resource_manager
+
+PHASES = ["events", "update", "draw", "present"]
+SPANS = ["room", "hud", "particles", "puzzle"]  # Measured inside "draw"
+COLUMNS = ["frame"] + PHASES + SPANS
+PHASE_COLORS = [NEON_YELLOW, NEON_GREEN, NEON_CYAN, NEON_PURPLE]
+PERCENTILES = [50, 95, 99]
+
+class FrameProfiler:
+    """Ring buffer of per-frame phase timings in ms."""
+    def __init__(self, capacity=PROFILER_CAPACITY):
+        self.capacity = capacity
+        self.samples = np.zeros((capacity, len(COLUMNS)))
+        self.columns = {name: i for i, name in enumerate(COLUMNS)}
+        self.current = [0.0] * len(COLUMNS)
+        self.frames = 0  # Frames recorded since start; the buffer holds the last `capacity`
+        self.frame_start = None
+        self.show_overlay = False
+        self.overlay_rect = pygame.Rect(WIDTH - PROFILER_GRAPH_SIZE[0] - 20, 10, PROFILER_GRAPH_SIZE[0] + 10, PROFILER_GRAPH_SIZE[1] + 120)
+        self.stat_lines = []
+
+    def begin_frame(self):
+        self.current = [0.0] * len(COLUMNS)
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if self.frame_start is None:
+            return
+        self.current[0] = (time.perf_counter() - self.frame_start) * 1000
+        self.samples[self.frames % self.capacity] = self.current
+        self.frames += 1
+        self.frame_start = None
+
+    @contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.current[self.columns[name]] += (time.perf_counter() - start) * 1000
+
+    def history(self):
+        """Recorded frames, oldest first."""
+        if self.frames <= self.capacity:
+            return self.samples[:self.frames]
+        split = self.frames % self.capacity
+        return np.concatenate((self.samples[split:], self.samples[:split]))
+
+    def stats(self):
+        frames = self.history()
+        if not len(frames):
+            return {}
+        values = np.percentile(frames, PERCENTILES, axis=0)
+        return {
+            name: dict({f"p{p}": float(values[i][column]) for i, p in enumerate(PERCENTILES)}, mean=float(frames[:, column].mean()))
+            for name, column in self.columns.items()
+        }
+
+    def dump(self, path):
+        """Writes the buffer to `path`; the format follows the extension."""
+        frames = self.history()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", newline="") as stream:
+            if path.endswith(".json"):
+                json.dump({'columns': COLUMNS, 'frames': frames.tolist(), 'stats': self.stats()}, stream, indent=2)
+            else:
+                writer = csv.writer(stream)
+                writer.writerow(COLUMNS)
+                writer.writerows(frames.round(4).tolist())
+        return path
+
+    def dump_snapshot(self):
+        name = time.strftime("frames_%Y%m%d_%H%M%S.") + PROFILE_DUMP_FORMAT
+        return self.dump(os.path.join(PROFILE_DUMP_DIR, name))
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        self.stat_lines = []
+
+    def build_graph(self):
+        # Stacked bars, one column per frame, coloured by phase; built as a pixel array
+        width, height = PROFILER_GRAPH_SIZE
+        frames = self.history()[-width:, 1:len(PHASES) + 1]
+        graph = np.zeros((width, height, 3), dtype=np.uint8)
+        graph[:] = DARK_CARBON
+        if len(frames):
+            tops = np.cumsum(frames, axis=1) * (height / PROFILER_GRAPH_MAX_MS)
+            rows = np.arange(height)[None, :, None]
+            phase = (rows >= tops[:, None, :]).sum(axis=2)
+            palette = np.array(PHASE_COLORS + [DARK_CARBON], dtype=np.uint8)
+            graph[width - len(frames):] = palette[phase]
+        # Flip so time grows upwards, then mark the frame budget
+        graph = graph[:, ::-1]
+        budget = height - 1 - int(height * (1000 / FPS) / PROFILER_GRAPH_MAX_MS)
+        if 0 <= budget < height:
+            graph[:, budget] = NEON_RED
+        return pygame.surfarray.make_surface(graph)
+
+    def draw(self, surface):
+        if not self.show_overlay:
+            return
+        if not self.stat_lines or self.frames % PROFILER_STATS_INTERVAL == 0:
+            # Percentiles over the whole buffer are only refreshed every few frames
+            stats = self.stats()
+            self.stat_lines = [resource_manager.render_text("ms        p50   p95   p99", FONT_MEDIUM, FONT_SIZE_SM, NEON_WHITE)]
+            for name, color in zip(["frame"] + PHASES, [NEON_WHITE] + PHASE_COLORS):
+                if name in stats:
+                    s = stats[name]
+                    line = f"{name:<8} {s['p50']:5.2f} {s['p95']:5.2f} {s['p99']:5.2f}"
+                    self.stat_lines.append(resource_manager.render_uncached(line, FONT_MEDIUM, FONT_SIZE_SM, color))
+        surface.blit(resource_manager.get_overlay("panel", self.overlay_rect.size), self.overlay_rect)
+        surface.blit(self.build_graph(), (self.overlay_rect.x + 5, self.overlay_rect.y + 5))
+        y = self.overlay_rect.y + PROFILER_GRAPH_SIZE[1] + 10
+        for line in self.stat_lines:
+            surface.blit(line, (self.overlay_rect.x + 5, y))
+            y += 17
+
+profiler = FrameProfiler()
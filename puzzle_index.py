@@ -0,0 +1,152 @@
+"""Precomputed, memory-mapped index of valid RSA puzzle keys.
+
+Every (p, q, e, d) tuple for a difficulty's prime table is enumerated
+once and written as fixed-size records, grouped by prime pair. Lookups
+open the file with mmap, so startup reads nothing and the pages are
+shared by every game process on the host. Build it with:
+    python puzzle_index.py build
+"""
+import argparse
+import math
+import mmap
+import os
+import random
+import struct
+import sys
+from array import array
+from crypto import PuzzleGenerator, is_probable_prime, random_coprime
+from config import PUZZLE_INDEX_PATH, PUZZLE_INDEX_MAX_E, PUZZLE_INDEX_DIFFICULTIES, RSA_KEY_TIERS, PRIME_TIERS
+
+INDEX_MAGIC = b"CSPX"
+INDEX_VERSION = 1
+HEADER = struct.Struct("<4sHH")
+# name, pair table byte offset, pair count, first record, record count
+DIFFICULTY_ENTRY = struct.Struct("<16sQIQQ")
+RECORD = struct.Struct("<IIII")  # p, q, e, d
+PAIR_OFFSET = struct.Struct("<I")
+
+def index_primes(difficulties=PUZZLE_INDEX_DIFFICULTIES):
+    """Prime tables for the requested difficulties whose keys fit in 32-bit records."""
+    generator = PuzzleGenerator(prime_tiers=PRIME_TIERS)
+    tables = {difficulty: generator.get_tier_primes(difficulty).tolist() for difficulty in PRIME_TIERS if difficulty in difficulties}
+    for difficulty, bits in RSA_KEY_TIERS.items():
+        half = bits // 2
+        if difficulty not in difficulties or bits % 2 or half > 16:
+            continue
+        # Same primes generate_prime() can return: exactly `half` bits, top two bits set
+        tables[difficulty] = [n for n in range(3 << (half - 2), 1 << half) if is_probable_prime(n)]
+    return tables
+
+def enumerate_keys(primes, max_e):
+    """Yields (p, q, records) per unordered prime pair, capping e values per pair."""
+    for i, p in enumerate(primes):
+        for q in primes[i + 1:]:
+            phi = (p - 1) * (q - 1)
+            if max_e and phi > 16 * max_e:
+                # Too many candidates to enumerate; sample distinct exponents instead
+                exponents = set()
+                while len(exponents) < max_e:
+                    exponents.add(random_coprime(phi))
+                exponents = sorted(exponents)
+            else:
+                exponents = [e for e in range(2, phi) if math.gcd(e, phi) == 1]
+                if max_e and len(exponents) > max_e:
+                    exponents = sorted(random.sample(exponents, max_e))
+            yield p, q, [(p, q, e, pow(e, -1, phi)) for e in exponents]
+
+def build_index(path, tables, max_e=PUZZLE_INDEX_MAX_E):
+    """Writes the index file and returns {difficulty: record count}."""
+    pair_tables = []
+    records = array('I')
+    entries = []
+    for difficulty, primes in tables.items():
+        first = len(records) // 4
+        offsets = array('I')
+        for p, q, keys in enumerate_keys(primes, max_e):
+            offsets.append(len(records) // 4 - first)
+            for record in keys:
+                records.extend(record)
+        offsets.append(len(records) // 4 - first)
+        pair_tables.append(offsets)
+        entries.append((difficulty, len(offsets) - 1, first, len(records) // 4 - first))
+    if sys.byteorder != "little":
+        records.byteswap()
+        for offsets in pair_tables:
+            offsets.byteswap()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as stream:
+        stream.write(HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(entries)))
+        pair_table_offset = HEADER.size + DIFFICULTY_ENTRY.size * len(entries)
+        for (difficulty, pair_count, first, count), offsets in zip(entries, pair_tables):
+            stream.write(DIFFICULTY_ENTRY.pack(difficulty.encode("utf-8"), pair_table_offset, pair_count, first, count))
+            pair_table_offset += PAIR_OFFSET.size * len(offsets)
+        for offsets in pair_tables:
+            offsets.tofile(stream)
+        records.tofile(stream)
+    return {difficulty: count for difficulty, _, _, count in entries}
+
+class PuzzleIndex:
+    """Read-only view of an index file; sampling is O(1) and copies nothing."""
+    def __init__(self, path):
+        with open(path, "rb") as stream:
+            self.buffer = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = HEADER.unpack_from(self.buffer, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError(f"Not a puzzle index (version {INDEX_VERSION}): {path}")
+        self.difficulties = {}
+        pair_tables_end = HEADER.size + DIFFICULTY_ENTRY.size * count
+        for i in range(count):
+            name, pair_table, pair_count, first, records = DIFFICULTY_ENTRY.unpack_from(self.buffer, HEADER.size + i * DIFFICULTY_ENTRY.size)
+            self.difficulties[name.rstrip(b"\0").decode("utf-8")] = (pair_table, pair_count, first, records)
+            pair_tables_end = max(pair_tables_end, pair_table + PAIR_OFFSET.size * (pair_count + 1))
+        self.records_offset = pair_tables_end
+
+    def __contains__(self, difficulty):
+        return difficulty in self.difficulties
+
+    def record_count(self, difficulty):
+        return self.difficulties[difficulty][3]
+
+    def read_record(self, index):
+        return RECORD.unpack_from(self.buffer, self.records_offset + index * RECORD.size)
+
+    def sample_key(self, difficulty):
+        # Uniform prime pair first, then uniform e within it, like PuzzleGenerator
+        pair_table, pair_count, first, _ = self.difficulties[difficulty]
+        pair = random.randrange(pair_count)
+        start, = PAIR_OFFSET.unpack_from(self.buffer, pair_table + pair * PAIR_OFFSET.size)
+        end, = PAIR_OFFSET.unpack_from(self.buffer, pair_table + (pair + 1) * PAIR_OFFSET.size)
+        p, q, e, d = self.read_record(first + random.randrange(start, end))
+        if random.random() < 0.5:
+            p, q = q, p
+        return p, q, e, d
+
+    def sample(self, difficulty):
+        p, q, e, _ = self.sample_key(difficulty)
+        n = p * q
+        m = random.randint(10, n // 2)
+        return {'p': p, 'q': q, 'e': e, 'C': pow(m, e, n), 'M_solution': str(m)}
+
+    def close(self):
+        self.buffer.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or inspect the precomputed puzzle index.")
+    parser.add_argument("command", choices=["build", "info"])
+    parser.add_argument("--path", default=PUZZLE_INDEX_PATH)
+    parser.add_argument("--max-e", type=int, default=PUZZLE_INDEX_MAX_E, help="e values kept per prime pair (0 keeps all)")
+    parser.add_argument("--difficulty", nargs="+", default=PUZZLE_INDEX_DIFFICULTIES)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    if args.command == "build":
+        random.seed(args.seed)
+        counts = build_index(args.path, index_primes(args.difficulty), args.max_e)
+    else:
+        index = PuzzleIndex(args.path)
+        counts = {difficulty: index.record_count(difficulty) for difficulty in index.difficulties}
+        index.close()
+    for difficulty, count in counts.items():
+        print(f"{difficulty}: {count} records")
+
+if __name__ == "__main__":
+    main()
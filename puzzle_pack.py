@@ -0,0 +1,176 @@
+"""Headless puzzle-pack generator.
+
+Mass-produces RSA puzzles across a process pool, verifies each one with
+crypto.solve, drops duplicates and streams them to JSONL or a compact
+binary pack. Example:
+    python puzzle_pack.py --count 1000000 --difficulty normal hard --output puzzles.jsonl
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import struct
+import sys
+import time
+from crypto import PuzzleGenerator, solve
+from config import RSA_KEY_TIERS, PRIME_TIERS
+
+PACK_MAGIC = b"CSPK"
+PACK_VERSION = 1
+FIELDS = ('p', 'q', 'e', 'C', 'M_solution')
+MAX_STALLED_CHUNKS = 20  # Chunks in a row without a new puzzle before a difficulty counts as exhausted
+
+def generate_chunk(task):
+    """Worker: generates and self-verifies one chunk of puzzles."""
+    difficulty, size, seed = task
+    random.seed(seed)
+    generator = PuzzleGenerator(RSA_KEY_TIERS, prime_tiers=PRIME_TIERS)
+    puzzles = []
+    rejected = 0
+    for _ in range(size):
+        puzzle = generator.generate_puzzle(difficulty)
+        if solve(puzzle['p'], puzzle['q'], puzzle['e'], puzzle['C']) != puzzle['M_solution']:
+            rejected += 1
+            continue
+        puzzles.append((puzzle['p'], puzzle['q'], puzzle['e'], puzzle['C'], int(puzzle['M_solution'])))
+    return difficulty, puzzles, rejected
+
+class JsonlWriter:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, difficulty, record):
+        puzzle = dict(zip(FIELDS, record))
+        puzzle['M_solution'] = str(puzzle['M_solution'])
+        puzzle['difficulty'] = difficulty
+        self.stream.write(json.dumps(puzzle) + "\n")
+
+class BinaryWriter:
+    """Header, difficulty name table, then records of a difficulty index followed
+    by five length-prefixed big-endian integers (p, q, e, C, M)."""
+    def __init__(self, stream, difficulties):
+        self.stream = stream
+        self.difficulty_ids = {difficulty: i for i, difficulty in enumerate(difficulties)}
+        stream.write(PACK_MAGIC + struct.pack("<HB", PACK_VERSION, len(difficulties)))
+        for difficulty in difficulties:
+            name = difficulty.encode("utf-8")
+            stream.write(struct.pack("<B", len(name)) + name)
+
+    def write(self, difficulty, record):
+        parts = [struct.pack("<B", self.difficulty_ids[difficulty])]
+        for value in record:
+            data = value.to_bytes((value.bit_length() + 7) // 8 or 1, "big")
+            parts.append(struct.pack("<H", len(data)) + data)
+        self.stream.write(b"".join(parts))
+
+def read_pack(path):
+    """Yields puzzle dicts from a JSONL or binary pack."""
+    with open(path, "rb") as stream:
+        if stream.read(4) != PACK_MAGIC:
+            stream.seek(0)
+            for line in stream:
+                yield json.loads(line)
+            return
+        version, count = struct.unpack("<HB", stream.read(3))
+        if version != PACK_VERSION:
+            raise ValueError(f"Unsupported pack version: {version}")
+        difficulties = []
+        for _ in range(count):
+            length = stream.read(1)[0]
+            difficulties.append(stream.read(length).decode("utf-8"))
+        while True:
+            header = stream.read(1)
+            if not header:
+                return
+            values = []
+            for _ in FIELDS:
+                length, = struct.unpack("<H", stream.read(2))
+                values.append(int.from_bytes(stream.read(length), "big"))
+            puzzle = dict(zip(FIELDS, values))
+            puzzle['M_solution'] = str(puzzle['M_solution'])
+            puzzle['difficulty'] = difficulties[header[0]]
+            yield puzzle
+
+def build_pack(count, difficulties, writer, workers, chunk_size, seed, max_stalled=MAX_STALLED_CHUNKS):
+    """Generates `count` unique puzzles per difficulty and returns run statistics.
+    Raises RuntimeError if a difficulty runs out of unique puzzles first."""
+    seen = set()
+    remaining = {difficulty: count for difficulty in difficulties}
+    in_flight = {difficulty: 0 for difficulty in difficulties}
+    stalled = {difficulty: 0 for difficulty in difficulties}
+    seeds = random.Random(seed)
+    stats = {'written': 0, 'duplicates': 0, 'rejected': 0}
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers) as pool:
+        pending = []
+
+        def submit():
+            # Each chunk covers only what is still missing after the chunks already queued
+            for difficulty in difficulties:
+                while len(pending) < workers * 2:
+                    size = min(chunk_size, remaining[difficulty] - in_flight[difficulty])
+                    if size <= 0:
+                        break
+                    in_flight[difficulty] += size
+                    task = (difficulty, size, seeds.getrandbits(64))
+                    pending.append((difficulty, size, pool.apply_async(generate_chunk, (task,))))
+
+        submit()
+        while pending:
+            difficulty, size, result = pending.pop(0)
+            in_flight[difficulty] -= size
+            _, puzzles, rejected = result.get()
+            stats['rejected'] += rejected
+            written = 0
+            for record in puzzles:
+                if not remaining[difficulty]:
+                    break
+                key = (difficulty,) + record[:4]
+                if key in seen:
+                    stats['duplicates'] += 1
+                    continue
+                seen.add(key)
+                writer.write(difficulty, record)
+                remaining[difficulty] -= 1
+                written += 1
+            stats['written'] += written
+            stalled[difficulty] = 0 if written or not remaining[difficulty] else stalled[difficulty] + 1
+            if stalled[difficulty] >= max_stalled:
+                raise RuntimeError(f"{difficulty}: no new unique puzzles in {max_stalled} chunks; "
+                                   f"wrote {count - remaining[difficulty]} of {count} "
+                                   f"({stats['written']} puzzles written in total)")
+            submit()
+    stats['seconds'] = time.perf_counter() - start
+    stats['per_second'] = stats['written'] / stats['seconds'] if stats['seconds'] else 0.0
+    stats['per_second_per_core'] = stats['per_second'] / workers
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate verified, deduplicated RSA puzzle packs.")
+    parser.add_argument("--count", type=int, default=10000, help="puzzles per difficulty")
+    parser.add_argument("--difficulty", nargs="+", default=["normal"], choices=list(PRIME_TIERS) + list(RSA_KEY_TIERS))
+    parser.add_argument("--output", default="-", help="output path, or - for stdout (JSONL only)")
+    parser.add_argument("--format", choices=["jsonl", "bin"], default=None, help="defaults to the output extension")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    output_format = args.format or ("bin" if args.output.endswith(".bin") else "jsonl")
+    if output_format == "bin" and args.output == "-":
+        parser.error("binary packs need an output path")
+    stream = sys.stdout if args.output == "-" else open(args.output, "w" if output_format == "jsonl" else "wb")
+    try:
+        writer = JsonlWriter(stream) if output_format == "jsonl" else BinaryWriter(stream, args.difficulty)
+        stats = build_pack(args.count, args.difficulty, writer, args.workers, args.chunk_size, args.seed)
+    except RuntimeError as error:
+        sys.exit(f"error: {error}")
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    print(f"{stats['written']} puzzles in {stats['seconds']:.2f}s "
+          f"({stats['per_second']:.0f} puzzles/s, {stats['per_second_per_core']:.0f} puzzles/s per core, "
+          f"{stats['duplicates']} duplicates, {stats['rejected']} failed verification)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
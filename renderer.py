@@ -0,0 +1,35 @@
+import pygame
+from config import *
+
+class DirtyRectRenderer:
+    """Pushes only the screen regions that changed since the last frame."""
+    def __init__(self, enabled=DIRTY_RECT_RENDERING):
+        self.enabled = enabled
+        self.previous_rects = []
+        self.current_rects = []
+        self.full_redraw = True
+        self.full_flips = 0
+        self.partial_updates = 0
+
+    def mark(self, rect):
+        if rect:
+            self.current_rects.append(pygame.Rect(rect))
+
+    def mark_all(self, rects):
+        for rect in rects:
+            self.mark(rect)
+
+    def force_full_redraw(self):
+        self.full_redraw = True
+
+    def present(self):
+        if not self.enabled or self.full_redraw:
+            pygame.display.flip()
+            self.full_flips += 1
+        else:
+            # Last frame's regions are included so vacated pixels get restored
+            pygame.display.update(self.previous_rects + self.current_rects)
+            self.partial_updates += 1
+        self.previous_rects = self.current_rects
+        self.current_rects = []
+        self.full_redraw = False
@@ -0,0 +1,110 @@
+"""Input recording and deterministic replay.
+
+A log holds the RNG seed and simulation step, followed by one record per
+frame: the frame's real delta in ms at full precision, the held movement
+keys and the pygame events handled that frame. Replaying feeds the same
+deltas, keys and events back, so the fixed-step simulation takes the
+same steps and reproduces the session exactly.
+"""
+import struct
+import pygame
+from timing import game_clock
+
+LOG_MAGIC = b"CSRL"
+LOG_VERSION = 2
+HEADER = struct.Struct("<4sHQd")  # magic, version, seed, simulation step in ms
+FRAME = struct.Struct("<dBH")  # dt ms, held-key bitmask, event count
+EVENT_TYPE = struct.Struct("<I")
+KEY_EVENT = struct.Struct("<iHB")  # key, mod, unicode byte length
+MOUSE_POS = struct.Struct("<hh")
+MOUSE_BUTTON = struct.Struct("<hhB")
+
+# Keys Player.update reads; their held state is stored as a bitmask
+RECORDED_KEYS = [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN, pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s]
+
+class KeyState:
+    """Stands in for pygame.key.get_pressed() with a set of held keys."""
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+def encode_event(event):
+    """Returns the bytes for an event the game handles, or None to drop it."""
+    if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+        text = getattr(event, "unicode", "").encode("utf-8")[:255]
+        return EVENT_TYPE.pack(event.type) + KEY_EVENT.pack(event.key, event.mod & 0xFFFF, len(text)) + text
+    if event.type == pygame.MOUSEMOTION:
+        return EVENT_TYPE.pack(event.type) + MOUSE_POS.pack(*event.pos)
+    if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        return EVENT_TYPE.pack(event.type) + MOUSE_BUTTON.pack(event.pos[0], event.pos[1], event.button)
+    if event.type == pygame.QUIT:
+        return EVENT_TYPE.pack(event.type)
+    return None
+
+def decode_event(data, offset):
+    """Returns (event, new offset)."""
+    event_type, = EVENT_TYPE.unpack_from(data, offset)
+    offset += EVENT_TYPE.size
+    if event_type in (pygame.KEYDOWN, pygame.KEYUP):
+        key, mod, length = KEY_EVENT.unpack_from(data, offset)
+        offset += KEY_EVENT.size
+        text = data[offset:offset + length].decode("utf-8")
+        offset += length
+        return pygame.event.Event(event_type, key=key, mod=mod, unicode=text), offset
+    if event_type == pygame.MOUSEMOTION:
+        x, y = MOUSE_POS.unpack_from(data, offset)
+        return pygame.event.Event(event_type, pos=(x, y)), offset + MOUSE_POS.size
+    if event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        x, y, button = MOUSE_BUTTON.unpack_from(data, offset)
+        return pygame.event.Event(event_type, pos=(x, y), button=button), offset + MOUSE_BUTTON.size
+    return pygame.event.Event(event_type), offset
+
+class InputRecorder:
+    """Appends one record per frame to a binary log."""
+    def __init__(self, path, seed, step_ms):
+        self.stream = open(path, "wb")
+        self.stream.write(HEADER.pack(LOG_MAGIC, LOG_VERSION, seed, step_ms))
+        self.frames = 0
+
+    def record_frame(self, dt, keys, events):
+        mask = 0
+        for bit, key in enumerate(RECORDED_KEYS):
+            if keys[key]:
+                mask |= 1 << bit
+        encoded = [data for data in map(encode_event, events) if data is not None]
+        self.stream.write(FRAME.pack(dt, mask, len(encoded)) + b"".join(encoded))
+        self.frames += 1
+
+    def close(self):
+        self.stream.close()
+
+class ReplayLog:
+    """Reads a log back frame by frame."""
+    def __init__(self, path, step_ms=None):
+        with open(path, "rb") as stream:
+            self.data = stream.read()
+        magic, version, self.seed, self.step_ms = HEADER.unpack_from(self.data, 0)
+        if magic != LOG_MAGIC or version != LOG_VERSION:
+            raise ValueError(f"Not a replay log (version {LOG_VERSION}): {path}")
+        # The same deltas only give the same steps if the step size matches the recording
+        expected = game_clock.step_ms if step_ms is None else step_ms
+        if self.step_ms != expected:
+            raise ValueError(f"Replay recorded at a {self.step_ms} ms step, this build uses {expected} ms: {path}")
+        self.offset = HEADER.size
+        self.frames = 0
+
+    def next_frame(self):
+        """Returns (dt, keys, events) for the next frame, or None at the end."""
+        if self.offset >= len(self.data):
+            return None
+        dt, mask, count = FRAME.unpack_from(self.data, self.offset)
+        self.offset += FRAME.size
+        events = []
+        for _ in range(count):
+            event, self.offset = decode_event(self.data, self.offset)
+            events.append(event)
+        keys = KeyState(key for bit, key in enumerate(RECORDED_KEYS) if mask & (1 << bit))
+        self.frames += 1
+        return dt, keys, events
@@ -0,0 +1,152 @@
+import pygame
+import threading
+from collections import OrderedDict
+from config import *
+from atlas import SpriteAtlas
+
+class ResourceManager:
+    """Shared cache for fonts, rendered text, overlays and atlas sprites. Cached
+    surfaces are kept in the display's pixel format so blits skip conversion."""
+    def __init__(self, text_cache_size=TEXT_CACHE_SIZE):
+        self.fonts = {}
+        self.text_cache = OrderedDict()
+        self.text_cache_size = text_cache_size
+        self.font_hits = 0
+        self.font_misses = 0
+        self.text_hits = 0
+        self.text_misses = 0
+        self.overlays = {}
+        self.atlas = SpriteAtlas(convert=lambda surface: self.convert(surface, alpha=True))
+        self.generation = 0  # Bumped whenever cached surfaces are dropped for a new display format
+        self.unconverted = False  # Set when a surface was kept as-is because no display existed yet
+        # The startup preloader fills these caches from a worker thread, and SDL_ttf isn't
+        # thread-safe: every font load, render and measurement in the game holds this lock
+        self.lock = threading.RLock()
+
+    def get_font(self, font_file, size):
+        """Returns the font for (font_file, size), loading it from disk only once."""
+        key = (font_file, size)
+        font = self.fonts.get(key)
+        if font is not None:
+            self.font_hits += 1
+            return font
+        with self.lock:
+            # FreeType can't open two faces at once, so loads are serialised
+            font = self.fonts.get(key)
+            if font is None:
+                self.font_misses += 1
+                font = pygame.font.Font(font_file, size)
+                self.fonts[key] = font
+        return font
+
+    def render_text(self, text, font_file, size, color, antialias=True):
+        """Returns a cached text surface. Callers must not draw onto it, and must
+        set the alpha on every blit if they change it."""
+        key = (text, font_file, size, tuple(color), antialias)
+        with self.lock:
+            surface = self.text_cache.get(key)
+            if surface is not None:
+                self.text_hits += 1
+                self.text_cache.move_to_end(key)
+                return surface
+            self.text_misses += 1
+            surface = self.convert(self.get_font(font_file, size).render(text, antialias, color), alpha=True)
+            self.text_cache[key] = surface
+            if len(self.text_cache) > self.text_cache_size:
+                self.text_cache.popitem(last=False)
+            return surface
+
+    def render_uncached(self, text, font_file, size, color, antialias=True):
+        """Renders text that changes too often to be worth caching, e.g. typed input."""
+        with self.lock:
+            return self.get_font(font_file, size).render(text, antialias, color)
+
+    def get_overlay(self, kind, size):
+        """Returns a cached overlay surface built once per (kind, size).
+        Callers vary intensity with set_alpha instead of rebuilding it."""
+        key = (kind, tuple(size))
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            overlay = self.build_overlay(kind, tuple(size))
+            self.overlays[key] = overlay
+        return overlay
+
+    def build_overlay(self, kind, size):
+        width, height = size
+        if kind == "vignette":
+            # Needs per-pixel alpha for the red ring
+            overlay = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.circle(overlay, VIGNETTE_GLOW, (width // 2, height // 2), width, width // 4)
+            return self.convert(overlay, alpha=True)
+        # Flat overlays use surface alpha, which blits faster than per-pixel alpha
+        colors = {
+            "alarm": ALARM_GLOW,
+            "dim": (0, 0, 0, 200),
+            "panel": (40, 40, 60, HUD_PANEL_ALPHA)
+        }
+        color = colors[kind]
+        overlay = self.convert(pygame.Surface(size))
+        overlay.fill(color[:3])
+        overlay.set_alpha(color[3])
+        return overlay
+
+    def convert(self, surface, alpha=False):
+        """Returns the surface in the display's pixel format. Before a display exists it is
+        returned unchanged, and sync_display() drops it once there is one."""
+        if pygame.display.get_surface() is None:
+            self.unconverted = True
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def sync_display(self):
+        """Called once a frame: if anything was built before the display existed, drops the
+        caches and bumps the generation so it all gets rebuilt in the display's format."""
+        if self.unconverted and pygame.display.get_surface() is not None:
+            self.display_changed()
+
+    def get_sprite(self, key, build):
+        """Returns the atlas sprite for `key`, calling build() to draw it the first time.
+        For small surfaces that live for the whole session: labels, glows, particles."""
+        sprite = self.atlas.get(key)
+        if sprite is None:
+            with self.lock:
+                sprite = self.atlas.get(key)
+                if sprite is None:
+                    sprite = self.atlas.add(key, self.convert(build(), alpha=True))
+        return sprite
+
+    def render_label(self, text, font_file, size, color):
+        """Text that rarely changes (labels, button captions), kept in the atlas instead of the
+        LRU text cache. Text that changes every few frames belongs in render_text: each new
+        string takes atlas space until the next flush."""
+        return self.get_sprite(("label", text, font_file, size, tuple(color)), lambda: self.get_font(font_file, size).render(text, True, color))
+
+    def display_changed(self):
+        # Cached surfaces were converted for the old display format; rebuild them on demand
+        with self.lock:
+            self.text_cache.clear()
+            self.overlays.clear()
+            self.atlas.clear()
+            self.unconverted = False
+            self.generation += 1
+
+    def stats(self):
+        return {
+            'font_hits': self.font_hits,
+            'font_misses': self.font_misses,
+            'text_hits': self.text_hits,
+            'text_misses': self.text_misses,
+            'fonts_loaded': len(self.fonts),
+            'text_cached': len(self.text_cache),
+            'atlas_sprites': len(self.atlas.sprites),
+            'atlas_pages': len(self.atlas.pages),
+            'atlas_flushes': self.atlas.flushes
+        }
+
+    def clear(self):
+        self.fonts.clear()
+        self.text_cache.clear()
+        self.overlays.clear()
+        self.atlas.clear()
+
+resource_manager = ResourceManager()
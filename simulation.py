@@ -0,0 +1,171 @@
+"""Headless balance simulation.
+
+Runs scripted playthroughs without a window, audio or frame cap and
+aggregates the outcomes. Example:
+    python simulation.py --sessions 2000 --oxygen-depletion 0.3
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import time
+import pygame
+import config
+import core
+from core import GameManager, Door, Terminal
+from timing import game_clock
+from replay import KeyState
+
+class ScriptedPlayer:
+    """Walks to the next locked terminal, solves it after a thinking delay,
+    then takes the first unlocked door out of the room."""
+    def __init__(self, gm, rng, think_time, error_rate):
+        self.gm = gm
+        self.rng = rng
+        self.think_time = think_time
+        self.error_rate = error_rate
+        self.think_until = None
+        self.attempts = 0
+
+    def choose_target(self):
+        objects = list(self.gm.current_room.objects)
+        for obj in objects:
+            if isinstance(obj, Terminal) and obj.is_locked:
+                return obj
+        for obj in objects:
+            if isinstance(obj, Door) and not obj.is_locked:
+                return obj
+        return None
+
+    def keys_toward(self, target):
+        player = self.gm.player.rect
+        pressed = []
+        if target.rect.centerx < player.centerx - player.width // 2:
+            pressed.append(pygame.K_LEFT)
+        elif target.rect.centerx > player.centerx + player.width // 2:
+            pressed.append(pygame.K_RIGHT)
+        if target.rect.centery < player.centery - player.height // 2:
+            pressed.append(pygame.K_UP)
+        elif target.rect.centery > player.centery + player.height // 2:
+            pressed.append(pygame.K_DOWN)
+        return KeyState(pressed)
+
+    def act(self):
+        """Decides the input for the next step; returns the keys to hold."""
+        if self.gm.game_state == config.STATE_PUZZLE_RSA:
+            puzzle = self.gm.current_puzzle
+            if self.think_until is None:
+                self.think_until = game_clock.now() + self.rng.uniform(*self.think_time)
+            elif game_clock.now() >= self.think_until:
+                self.think_until = None
+                self.attempts += 1
+                wrong = self.rng.random() < self.error_rate
+                puzzle.input_text = "0" if wrong else str(puzzle.solution)
+                puzzle.check_solution(self.gm)
+                return KeyState(), not wrong
+            return KeyState(), False
+        target = self.choose_target()
+        if target is None:
+            return KeyState(), False
+        if self.gm.player.rect.colliderect(target.rect):
+            self.gm.interact()
+            return KeyState(), False
+        return self.keys_toward(target), False
+
+def run_session(options):
+    """Plays one session to a win, death or timeout and returns its outcome."""
+    seed, max_seconds, think_time, error_rate, overrides = options
+    for name, value in overrides.items():
+        setattr(core, name, value)
+    game_clock.reset()
+    gm = GameManager(headless=True, seed=seed)
+    bot = ScriptedPlayer(gm, random.Random(seed), think_time, error_rate)
+    gm.start_gameplay()
+    start = game_clock.now()
+    solve_times = []
+    outcome = "timeout"
+    while game_clock.now() - start < max_seconds * 1000:
+        keys, solved = bot.act()
+        if solved:
+            solve_times.append((game_clock.now() - start) / 1000)
+        if gm.game_state in [config.STATE_CUTSCENE_OUTRO, config.STATE_WIN_SCREEN]:
+            outcome = "win"
+            break
+        gm.advance(keys)
+        if gm.game_state == config.STATE_GAME_OVER:
+            outcome = "death"
+            break
+    return {
+        'seed': seed,
+        'outcome': outcome,
+        'seconds': (game_clock.now() - start) / 1000,
+        'solve_times': solve_times,
+        'attempts': bot.attempts,
+        'oxygen': gm.player.oxygen,
+        'suit_integrity': gm.player.suit_integrity
+    }
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def summarize(results):
+    summary = {'sessions': len(results)}
+    for outcome in ["win", "death", "timeout"]:
+        times = [r['seconds'] for r in results if r['outcome'] == outcome]
+        summary[outcome] = {'count': len(times)}
+        if times:
+            summary[outcome].update(mean=statistics.mean(times), median=statistics.median(times), p95=percentile(times, 0.95))
+    solves = {}
+    for result in results:
+        for i, seconds in enumerate(result['solve_times']):
+            solves.setdefault(i + 1, []).append(seconds)
+    summary['solve_times'] = {
+        terminal: {'count': len(times), 'mean': statistics.mean(times), 'p95': percentile(times, 0.95)}
+        for terminal, times in sorted(solves.items())
+    }
+    return summary
+
+def run_batch(sessions, workers, seed, max_seconds, think_time, error_rate, overrides):
+    tasks = [(seed + i, max_seconds, think_time, error_rate, overrides) for i in range(sessions)]
+    with multiprocessing.Pool(workers) as pool:
+        return pool.map(run_session, tasks, chunksize=max(1, sessions // (workers * 4)))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run headless playthroughs and aggregate outcomes.")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-seconds", type=float, default=900, help="simulated seconds before a session times out")
+    parser.add_argument("--think-time", type=float, nargs=2, default=[5000, 40000], metavar=("MIN_MS", "MAX_MS"), help="time spent on each puzzle attempt")
+    parser.add_argument("--error-rate", type=float, default=0.3, help="chance a puzzle attempt is wrong")
+    parser.add_argument("--oxygen-depletion", type=float, default=None, help="overrides OXYGEN_DEPLETION")
+    parser.add_argument("--suit-damage-rate", type=float, default=None, help="overrides SUIT_DAMAGE_RATE")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+    overrides = {}
+    if args.oxygen_depletion is not None:
+        overrides['OXYGEN_DEPLETION'] = args.oxygen_depletion
+    if args.suit_damage_rate is not None:
+        overrides['SUIT_DAMAGE_RATE'] = args.suit_damage_rate
+    start = time.perf_counter()
+    results = run_batch(args.sessions, args.workers, args.seed, args.max_seconds, tuple(args.think_time), args.error_rate, overrides)
+    summary = summarize(results)
+    summary['wall_seconds'] = time.perf_counter() - start
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    print(f"{summary['sessions']} sessions in {summary['wall_seconds']:.1f}s")
+    for outcome in ["win", "death", "timeout"]:
+        stats = summary[outcome]
+        line = f"  {outcome:<8} {stats['count']:>6}"
+        if stats['count']:
+            line += f"  mean {stats['mean']:.1f}s  median {stats['median']:.1f}s  p95 {stats['p95']:.1f}s"
+        print(line)
+    for terminal, stats in summary['solve_times'].items():
+        print(f"  terminal {terminal} solved by {stats['mean']:.1f}s on average (p95 {stats['p95']:.1f}s, n={stats['count']})")
+
+if __name__ == "__main__":
+    main()
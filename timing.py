@@ -0,0 +1,51 @@
+import time
+from config import *
+
+class GameClock:
+    """Single time source for the game: one real timestamp per frame, and a
+    simulation clock that advances in fixed steps drained from an accumulator."""
+    def __init__(self, step_ms=SIM_STEP_MS, max_frame_ms=MAX_FRAME_MS):
+        self.step_ms = step_ms
+        self.max_frame_ms = max_frame_ms
+        self.time = 0.0  # Simulation time in ms, advanced only by step()
+        self.frame_time = None  # Real time in ms at the start of the frame
+        self.dt = 0.0  # Real ms since the previous frame, clamped to max_frame_ms
+        self.accumulator = 0.0
+        self.alpha = 0.0  # Fraction of a step left over, for render interpolation
+
+    def begin_frame(self, real_ms=None):
+        if real_ms is None:
+            # Read directly so the clock works without pygame's timer subsystem
+            real_ms = time.perf_counter() * 1000
+        previous = real_ms if self.frame_time is None else self.frame_time
+        # Clamp long stalls so the simulation doesn't spiral trying to catch up
+        self.dt = min(real_ms - previous, self.max_frame_ms)
+        self.frame_time = real_ms
+        self.accumulator += self.dt
+
+    def advance(self, ms):
+        """Starts a frame `ms` after the previous one without reading the real clock."""
+        self.frame_time = (self.frame_time or 0) + ms
+        self.dt = ms
+        self.accumulator += ms
+
+    def step(self):
+        """Advances one fixed step if enough time has accumulated."""
+        if self.accumulator >= self.step_ms:
+            self.accumulator -= self.step_ms
+            self.time += self.step_ms
+            return True
+        self.alpha = self.accumulator / self.step_ms
+        return False
+
+    def now(self):
+        return self.time
+
+    def reset(self):
+        self.time = 0.0
+        self.frame_time = None
+        self.dt = 0.0
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+game_clock = GameClock()
@@ -1,41 +1,66 @@
 import pygame
 import random
 import math
+import numpy as np
 from config import *
+from resources import resource_manager
+from audio import SoundBank, MusicManager
+from timing import game_clock
+from profiler import profiler
 
-class Particle:
-    def __init__(self):
-        self.reset()
+class ParticleSystem:
+    """Background particles stored in NumPy arrays and stepped in one vectorized update."""
+    def __init__(self, count=PARTICLE_COUNT, seed=None):
+        self.count = count
+        self.rng = np.random.default_rng(seed)
+        self.x = np.zeros(count)
+        self.y = np.zeros(count)
+        self.vx = np.zeros(count)
+        self.vy = np.zeros(count)
+        self.size = np.zeros(count, dtype=np.int32)
+        self.alpha_level = np.zeros(count, dtype=np.int32)
+        self.respawn(np.ones(count, dtype=bool))
 
-    def reset(self):
-        # Set random position and movement
-        self.x = random.randint(0, WIDTH)
-        self.y = random.randint(0, HEIGHT)
-        self.vx = random.uniform(-PARTICLE_SPEED, PARTICLE_SPEED)
-        self.vy = random.uniform(-PARTICLE_SPEED, PARTICLE_SPEED)
-        self.size = random.randint(1, 3)
-        self.alpha = random.randint(50, 100)
+    def respawn(self, mask):
+        # Set random position and movement for the masked particles
+        n = int(mask.sum())
+        if not n:
+            return
+        self.x[mask] = self.rng.integers(0, WIDTH + 1, n)
+        self.y[mask] = self.rng.integers(0, HEIGHT + 1, n)
+        self.vx[mask] = self.rng.uniform(-PARTICLE_SPEED, PARTICLE_SPEED, n)
+        self.vy[mask] = self.rng.uniform(-PARTICLE_SPEED, PARTICLE_SPEED, n)
+        self.size[mask] = self.rng.integers(1, 4, n)
+        self.alpha_level[mask] = self.rng.integers(0, PARTICLE_ALPHA_LEVELS, n)
 
     def update(self):
-        # Move particle
         self.x += self.vx
         self.y += self.vy
-        # Reset if particle goes off screen
-        if self.x < 0 or self.x > WIDTH or self.y < 0 or self.y > HEIGHT:
-            self.reset()
+        # Reset particles that went off screen
+        self.respawn((self.x < 0) | (self.x > WIDTH) | (self.y < 0) | (self.y > HEIGHT))
+
+    def get_sprite(self, size, alpha_level):
+        # Glow sprites are rendered once per (size, alpha level) into the shared atlas
+        return resource_manager.get_sprite(("particle", size, alpha_level), lambda: self.build_sprite(size, alpha_level))
+
+    def build_sprite(self, size, alpha_level):
+        sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        alpha = PARTICLE_GLOW[3] * (PARTICLE_ALPHA_LEVELS + alpha_level) // (2 * PARTICLE_ALPHA_LEVELS - 1)
+        pygame.draw.circle(sprite, PARTICLE_GLOW[:3] + (alpha,), (size, size), size)
+        return sprite
 
     def draw(self, surface):
-        # Draw glowing particle
-        particle_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(particle_surface, PARTICLE_GLOW, (self.size, self.size), self.size)
-        surface.blit(particle_surface, (int(self.x) - self.size, int(self.y) - self.size))
+        with profiler.span("particles"):
+            xs = (self.x.astype(np.int32) - self.size).tolist()
+            ys = (self.y.astype(np.int32) - self.size).tolist()
+            sprites = [self.get_sprite(size, level) for size, level in zip(self.size.tolist(), self.alpha_level.tolist())]
+            surface.blits(list(zip(sprites, zip(xs, ys))), doreturn=False)
 
 class Button(pygame.sprite.Sprite):
     def __init__(self, x, y, width, height, text, action=None):
         super().__init__()
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
-        self.font = pygame.font.Font(FONT_MEDIUM, FONT_SIZE_MD)
         self.base_color = DARK_GLOW
         self.text_color = NEON_WHITE
         self.action = action
@@ -54,7 +79,7 @@ class Button(pygame.sprite.Sprite):
         else:
             self.glow_alpha = max(self.glow_alpha - self.glow_speed, 0)
         # Handle click animation
-        if self.click_time and pygame.time.get_ticks() - self.click_time < self.click_duration:
+        if self.click_time and game_clock.now() - self.click_time < self.click_duration:
             self.click_scale = 0.95
         else:
             self.click_scale = 1.0
@@ -67,27 +92,92 @@ class Button(pygame.sprite.Sprite):
             self.rect.width * self.click_scale,
             self.rect.height * self.click_scale
         )
-        # Draw glow effect
-        glow_surface = pygame.Surface((self.rect.width + 20, self.rect.height + 20), pygame.SRCALPHA)
-        pygame.draw.rect(glow_surface, (0, 255, 255, int(self.glow_alpha)), (10, 10, self.rect.width, self.rect.height), border_radius=10)
-        surface.blit(glow_surface, (self.rect.x - 10, self.rect.y - 10))
+        # Draw glow effect: one full-strength glow in the atlas, faded with surface alpha
+        if self.glow_alpha > 0:
+            glow_surface = resource_manager.get_sprite(("button_glow", self.rect.size), self.build_glow)
+            glow_surface.set_alpha(int(self.glow_alpha))
+            surface.blit(glow_surface, (self.rect.x - 10, self.rect.y - 10))
         # Draw button background and border
         pygame.draw.rect(surface, self.base_color, scaled_rect, border_radius=5)
         pygame.draw.rect(surface, NEON_CYAN, scaled_rect, 2, border_radius=5)
         # Draw button text
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = resource_manager.render_label(self.text, FONT_MEDIUM, FONT_SIZE_MD, self.text_color)
         surface.blit(text_surface, (scaled_rect.centerx - text_surface.get_width() // 2, scaled_rect.centery - text_surface.get_height() // 2))
 
+    def build_glow(self):
+        glow_surface = pygame.Surface((self.rect.width + 20, self.rect.height + 20), pygame.SRCALPHA)
+        pygame.draw.rect(glow_surface, (0, 255, 255, 255), (10, 10, self.rect.width, self.rect.height), border_radius=10)
+        return glow_surface
+
     def handle_event(self, event):
         # Handle mouse events
         if event.type == pygame.MOUSEMOTION:
             self.is_hovered = self.rect.collidepoint(event.pos)
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.is_hovered and self.action:
-            self.click_time = pygame.time.get_ticks()
+            self.click_time = game_clock.now()
             self.action()
             return True
         return False
 
+class HUD:
+    """Oxygen/suit panel and radar kept as pre-rendered surfaces. The panel is
+    rebuilt only when a displayed integer percentage changes and the radar
+    only when the current room does."""
+    def __init__(self, map_positions, rect=HUD_RECT):
+        self.map_positions = map_positions
+        self.rect = pygame.Rect(rect)
+        self.panel = None
+        self.panel_values = None
+        # Room dots reach 8px past the ring, so the radar surface is padded by that much
+        self.radar_pos = (WIDTH - MINI_MAP_RADIUS * 2 - 28, 12)
+        self.radar = None
+        self.radar_room = None
+        self.generation = resource_manager.generation  # Both parts are rebuilt after a display change
+
+    def build_panel(self, oxygen, suit):
+        panel = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        panel.fill((40, 40, 60, HUD_PANEL_ALPHA))
+        pygame.draw.rect(panel, NEON_CYAN, panel.get_rect(), 2, border_radius=10)
+        for y, value, color, label in [(10, oxygen, NEON_GREEN, "Oxygen"), (50, suit, NEON_LIGHT_BLUE, "Suit")]:
+            pygame.draw.rect(panel, DARK_GLOW, (10, y, 180, 20), 0, 5)
+            pygame.draw.rect(panel, color, (10, y, int(180 * value / 100), 20), 0, 5)
+            pygame.draw.rect(panel, NEON_CYAN, (10, y, 180, 20), 1, 5)
+            # The panel is the cache, so the label skips the shared text cache
+            panel.blit(resource_manager.render_uncached(f"{label}: {value}%", FONT_MEDIUM, FONT_SIZE_SM, NEON_WHITE), (10, y + 25))
+        return resource_manager.convert(panel, alpha=True)
+
+    def build_radar(self, room_key):
+        label = resource_manager.render_label("RADAR", FONT_MEDIUM, FONT_SIZE_SM, NEON_WHITE)
+        center = (MINI_MAP_RADIUS + 8, MINI_MAP_RADIUS + 8)
+        radar = pygame.Surface(((MINI_MAP_RADIUS + 8) * 2, center[1] + MINI_MAP_RADIUS + 5 + label.get_height()), pygame.SRCALPHA)
+        pygame.draw.circle(radar, HOLO_GLOW, center, MINI_MAP_RADIUS)
+        pygame.draw.circle(radar, NEON_CYAN, center, MINI_MAP_RADIUS, 2)
+        for key, (dx, dy) in self.map_positions.items():
+            pos = (center[0] + dx * MINI_MAP_RADIUS, center[1] + dy * MINI_MAP_RADIUS)
+            color = NEON_GREEN if key == room_key else NEON_BLUE
+            pygame.draw.circle(radar, color, pos, 8)  # Larger dots for visibility
+        radar.blit(label, (center[0] - label.get_width() // 2, center[1] + MINI_MAP_RADIUS + 5))
+        return resource_manager.convert(radar, alpha=True)
+
+    def draw_panel(self, surface, player):
+        """Blits the status panel, rebuilding it first if needed. Returns True if it was rebuilt."""
+        if self.generation != resource_manager.generation:
+            self.generation = resource_manager.generation
+            self.panel = self.radar = None
+        values = (int(player.oxygen), int(player.suit_integrity))
+        rebuilt = self.panel is None or values != self.panel_values
+        if rebuilt:
+            self.panel = self.build_panel(*values)
+            self.panel_values = values
+        surface.blit(self.panel, self.rect)
+        return rebuilt
+
+    def draw_radar(self, surface, room_key):
+        if self.radar is None or room_key != self.radar_room:
+            self.radar = self.build_radar(room_key)
+            self.radar_room = room_key
+        surface.blit(self.radar, self.radar_pos)
+
 class UIManager:
     def __init__(self, game_manager):
         self.gm = game_manager
@@ -95,88 +185,56 @@ class UIManager:
         self.message_color = NEON_WHITE
         self.message_start = 0
         self.message_alpha = 255
-        self.particles = [Particle() for _ in range(PARTICLE_COUNT)]
+        self.particles = ParticleSystem(seed=self.gm.seed)
         self.flicker_state = True
         self.last_flicker = 0
         self.flicker_interval = 2000
-        self.music_playing = False
-        self.ambience_playing = False
         self.low_oxygen_channel = None
+        # Decoding is left to the startup preloader (see GameManager.preload_tasks)
+        self.sound_bank = SoundBank(preload=False)
+        self.music = MusicManager(preload=False)
         self.tooltip = ""
         self.tooltip_alpha = 0
         self.tooltip_start = 0
+        self.hud = HUD(self.gm.level.map_positions())
+        self.hud_dirty = True
 
     def set_message(self, message, color=NEON_WHITE):
         self.message = message
         self.message_color = color
-        self.message_start = pygame.time.get_ticks()
+        self.message_start = game_clock.now()
         self.message_alpha = 255
 
     def set_tooltip(self, tooltip):
         self.tooltip = tooltip
-        self.tooltip_start = pygame.time.get_ticks()
+        self.tooltip_start = game_clock.now()
         self.tooltip_alpha = 0
 
     def play_menu_music(self):
-        if not self.music_playing and os.path.exists(MENU_MUSIC):
-            try:
-                pygame.mixer.music.load(MENU_MUSIC)
-                pygame.mixer.music.set_volume(0.3)
-                pygame.mixer.music.play(-1)
-                self.music_playing = True
-            except pygame.error:
-                pass
-
-    def stop_music(self):
-        if self.music_playing:
-            pygame.mixer.music.stop()
-            self.music_playing = False
+        self.music.play(MENU_MUSIC)
 
     def play_gameplay_ambience(self):
-        if not self.ambience_playing and os.path.exists(STATION_AMBIENCE):
-            try:
-                pygame.mixer.music.load(STATION_AMBIENCE)
-                pygame.mixer.music.set_volume(0.2)
-                pygame.mixer.music.play(-1)
-                self.ambience_playing = True
-            except pygame.error:
-                pass
-
-    def stop_gameplay_ambience(self):
-        if self.ambience_playing:
-            pygame.mixer.music.stop()
-            self.ambience_playing = False
+        self.music.play(STATION_AMBIENCE)
+
+    def stop_music(self):
+        self.music.stop()
 
     def play_low_oxygen_alert(self):
-        if not self.low_oxygen_channel and os.path.exists(LOW_OXYGEN_ALERT):
-            try:
-                sound = pygame.mixer.Sound(LOW_OXYGEN_ALERT)
-                self.low_oxygen_channel = pygame.mixer.Channel(1)
-                self.low_oxygen_channel.set_volume(0.6)
-                self.low_oxygen_channel.play(sound, loops=-1)
-            except pygame.error:
-                pass
+        if not self.low_oxygen_channel:
+            self.low_oxygen_channel = self.sound_bank.play(LOW_OXYGEN_ALERT, 0.6, loops=-1)
 
     def stop_low_oxygen_alert(self):
         if self.low_oxygen_channel:
-            self.low_oxygen_channel.stop()
+            self.sound_bank.stop(LOW_OXYGEN_ALERT)
             self.low_oxygen_channel = None
 
     def play_sound(self, sound_file, volume):
-        if os.path.exists(sound_file):
-            try:
-                sound = pygame.mixer.Sound(sound_file)
-                channel = pygame.mixer.find_channel()
-                if channel:
-                    channel.set_volume(volume)
-                    channel.play(sound)
-            except pygame.error:
-                pass
+        self.sound_bank.play(sound_file, volume)
 
     def update(self):
-        for particle in self.particles:
-            particle.update()
-        current_time = pygame.time.get_ticks()
+        if self.gm.game_state in PARTICLE_STATES:
+            self.particles.update()
+        current_time = game_clock.now()
         if current_time - self.last_flicker >= self.flicker_interval:
             self.flicker_state = not self.flicker_state
             self.last_flicker = current_time
@@ -193,83 +251,48 @@ class UIManager:
                 self.tooltip_alpha = max(0, 255 - int(255 * elapsed / TOOLTIP_FADE_DURATION))
                 if self.tooltip_alpha == 0:
                     self.tooltip = ""
-        if self.gm.game_state == STATE_GAMEPLAY and not self.ambience_playing:
-            self.play_gameplay_ambience()
+        self.music.update()
         if self.gm.game_state == STATE_GAMEPLAY and self.gm.player.oxygen <= VIGNETTE_THRESHOLD and not self.low_oxygen_channel:
             self.play_low_oxygen_alert()
         elif self.gm.game_state != STATE_GAMEPLAY or self.gm.player.oxygen > VIGNETTE_THRESHOLD:
             self.stop_low_oxygen_alert()
 
-    def draw_mini_map(self, surface):
-        center = (WIDTH - MINI_MAP_RADIUS - 20, MINI_MAP_RADIUS + 20)
-        map_surface = pygame.Surface((MINI_MAP_RADIUS * 2, MINI_MAP_RADIUS * 2), pygame.SRCALPHA)
-        pygame.draw.circle(map_surface, HOLO_GLOW, (MINI_MAP_RADIUS, MINI_MAP_RADIUS), MINI_MAP_RADIUS)
-        surface.blit(map_surface, (center[0] - MINI_MAP_RADIUS, center[1] - MINI_MAP_RADIUS))
-        pygame.draw.circle(surface, NEON_CYAN, center, MINI_MAP_RADIUS, 2)
-        room_positions = {
-            "control_room": (0, -MINI_MAP_RADIUS * 0.6),  # Top
-            "lab_room": (0, 0),                          # Center
-            "distress_room": (0, MINI_MAP_RADIUS * 0.6)  # Bottom
-        }
-        current_room_key = self.gm.current_room.name.lower().replace(" ", "_")
-        for room_key, (dx, dy) in room_positions.items():
-            pos = (center[0] + dx, center[1] + dy)
-            color = NEON_GREEN if room_key == current_room_key else NEON_BLUE
-            pygame.draw.circle(surface, color, pos, 8)  # Larger dots for visibility
-        font = pygame.font.Font(FONT_MEDIUM, FONT_SIZE_SM)
-        label = font.render("RADAR", True, NEON_WHITE)
-        surface.blit(label, (center[0] - label.get_width() // 2, center[1] + MINI_MAP_RADIUS + 5))
+    def get_dirty_rects(self):
+        # The HUD panel when its numbers changed, plus the message and tooltip lines while they are visible.
+        # The radar only changes with the room, which already forces a full redraw.
+        rects = [self.hud.rect] if self.hud_dirty else []
+        line_height = resource_manager.get_font(FONT_MEDIUM, FONT_SIZE_MD).get_height()
+        if self.message and self.message_alpha > 0:
+            rects.append(pygame.Rect(0, HEIGHT - 30, WIDTH, line_height))
+        if self.tooltip and self.tooltip_alpha > 0:
+            rects.append(pygame.Rect(0, HEIGHT - 100, WIDTH, line_height))
+        return rects
 
     def draw_gameplay(self, surface):
-        hud_rect = pygame.Rect(10, 10, 220, 100)
-        panel = pygame.Surface((220, 100), pygame.SRCALPHA)
-        panel.fill((40, 40, 60, HUD_PANEL_ALPHA))
-        surface.blit(panel, hud_rect)
-        pygame.draw.rect(surface, NEON_CYAN, hud_rect, 2, border_radius=10)
-        font = pygame.font.Font(FONT_MEDIUM, FONT_SIZE_SM)
-        oxygen_width = int(180 * (self.gm.player.oxygen / 100))
-        pygame.draw.rect(surface, DARK_GLOW, (20, 20, 180, 20), 0, 5)
-        pygame.draw.rect(surface, NEON_GREEN, (20, 20, oxygen_width, 20), 0, 5)
-        pygame.draw.rect(surface, NEON_CYAN, (20, 20, 180, 20), 1, 5)
-        oxygen_text = font.render(f"Oxygen: {int(self.gm.player.oxygen)}%", True, NEON_WHITE)
-        surface.blit(oxygen_text, (20, 45))
-        suit_width = int(180 * (self.gm.player.suit_integrity / 100))
-        pygame.draw.rect(surface, DARK_GLOW, (20, 60, 180, 20), 0, 5)
-        pygame.draw.rect(surface, NEON_LIGHT_BLUE, (20, 60, suit_width, 20), 0, 5)
-        pygame.draw.rect(surface, NEON_CYAN, (20, 60, 180, 20), 1, 5)
-        suit_text = font.render(f"Suit: {int(self.gm.player.suit_integrity)}%", True, NEON_WHITE)
-        surface.blit(suit_text, (20, 85))
+        self.hud_dirty = self.hud.draw_panel(surface, self.gm.player)
         if self.gm.player.oxygen <= VIGNETTE_THRESHOLD:
-            vignette = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            pygame.draw.circle(vignette, VIGNETTE_GLOW, (WIDTH // 2, HEIGHT // 2), WIDTH, WIDTH // 4)
-            surface.blit(vignette, (0, 0))
+            surface.blit(resource_manager.get_overlay("vignette", surface.get_size()), (0, 0))
         if self.message and self.message_alpha > 0:
-            font = pygame.font.Font(FONT_MEDIUM, FONT_SIZE_MD)
-            message_surface = font.render(self.message, True, self.message_color)
+            message_surface = resource_manager.render_text(self.message, FONT_MEDIUM, FONT_SIZE_MD, self.message_color)
             message_surface.set_alpha(self.message_alpha)
             surface.blit(message_surface, (WIDTH // 2 - message_surface.get_width() // 2, HEIGHT - 30))
         if self.tooltip and self.tooltip_alpha > 0:
-            font = pygame.font.Font(FONT_MEDIUM, FONT_SIZE_MD)
-            tooltip_surface = font.render(self.tooltip, True, NEON_CYAN)
+            tooltip_surface = resource_manager.render_text(self.tooltip, FONT_MEDIUM, FONT_SIZE_MD, NEON_CYAN)
             tooltip_surface.set_alpha(self.tooltip_alpha)
             surface.blit(tooltip_surface, (WIDTH // 2 - tooltip_surface.get_width() // 2, HEIGHT - 100))
-        self.draw_mini_map(surface)
+        self.hud.draw_radar(surface, self.gm.current_room.key)
         if self.gm.alarm_on and self.gm.alarm_visible:
-            alarm = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            alarm.fill(ALARM_GLOW)
+            alarm = resource_manager.get_overlay("alarm", surface.get_size())
+            alarm.set_alpha(ALARM_GLOW[3])
             surface.blit(alarm, (0, 0))
 
     def draw_menu(self, buttons):
         self.gm.screen.fill(NEON_BLACK)
-        for particle in self.particles:
-            particle.draw(self.gm.screen)
+        self.particles.draw(self.gm.screen)
         rect = pygame.Rect(WIDTH // 4, HEIGHT // 4 - 20, WIDTH // 2, HEIGHT // 2 + 100)
-        panel = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        panel.fill((40, 40, 60, HUD_PANEL_ALPHA))
-        self.gm.screen.blit(panel, rect)
+        self.gm.screen.blit(resource_manager.get_overlay("panel", rect.size), rect)
         pygame.draw.rect(self.gm.screen, NEON_CYAN, rect, 3, border_radius=10)
-        font_xl = pygame.font.Font(FONT_BOLD, FONT_SIZE_XL)
-        title = font_xl.render("Crypternity", True, NEON_WHITE if self.flicker_state else NEON_CYAN)
+        title = resource_manager.render_text("Crypternity", FONT_BOLD, FONT_SIZE_XL, NEON_WHITE if self.flicker_state else NEON_CYAN)
         self.gm.screen.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 4 ))
         # font_md = pygame.font.Font(FONT_MEDIUM, FONT_SIZE_MD)
         # subtitle = font_md.render("Martian Decipher", True, NEON_CYAN)
@@ -277,21 +300,24 @@ class UIManager:
         for button in buttons:
             button.update()
             button.draw(self.gm.screen)
-        self.play_menu_music()
+        preloader = self.gm.preloader
+        if preloader and not preloader.done:
+            # Remaining assets are still loading in the background
+            bar = pygame.Rect(rect.x + 40, rect.bottom - 30, rect.width - 80, 6)
+            pygame.draw.rect(self.gm.screen, DARK_GLOW, bar)
+            pygame.draw.rect(self.gm.screen, NEON_CYAN, (bar.x, bar.y, int(bar.width * preloader.progress), bar.height))
+            label = resource_manager.render_text(f"Loading {preloader.current}...", FONT_MEDIUM, FONT_SIZE_SM, NEON_CYAN)
+            self.gm.screen.blit(label, (WIDTH // 2 - label.get_width() // 2, bar.y - 20))
 
     def draw_how_to_play(self, text_lines, back_button):
         self.gm.screen.fill(NEON_BLACK)
-        for particle in self.particles:
-            particle.draw(self.gm.screen)
+        self.particles.draw(self.gm.screen)
         rect = pygame.Rect(WIDTH // 8, HEIGHT // 8, WIDTH * 6 // 8, HEIGHT * 6 // 8)
-        panel = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        panel.fill((40, 40, 60, HUD_PANEL_ALPHA))
-        self.gm.screen.blit(panel, rect)
+        self.gm.screen.blit(resource_manager.get_overlay("panel", rect.size), rect)
         pygame.draw.rect(self.gm.screen, NEON_CYAN, rect, 3, border_radius=10)
-        font = pygame.font.Font(FONT_MEDIUM, FONT_SIZE_MD)
         y = HEIGHT // 8 + 30
         for line in text_lines:
-            text = font.render(line, True, NEON_WHITE)
+            text = resource_manager.render_text(line, FONT_MEDIUM, FONT_SIZE_MD, NEON_WHITE)
             self.gm.screen.blit(text, (WIDTH // 2 - text.get_width() // 2, y))
             y += 25
         back_button.update()
@@ -299,32 +325,24 @@ class UIManager:
 
     def draw_game_over(self, restart_button):
         self.gm.screen.fill(NEON_BLACK)
-        for particle in self.particles:
-            particle.draw(self.gm.screen)
-        font_lg = pygame.font.Font(FONT_BOLD, FONT_SIZE_LG)
-        font_md = pygame.font.Font(FONT_MEDIUM, FONT_SIZE_MD)
-        title = font_lg.render("MISSION FAILED", True, NEON_RED)
+        self.particles.draw(self.gm.screen)
+        title = resource_manager.render_text("MISSION FAILED", FONT_BOLD, FONT_SIZE_LG, NEON_RED)
         self.gm.screen.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 2 - 80))
-        message = font_md.render("Oxygen Depleted or Suit Breached!", True, NEON_WHITE)
+        message = resource_manager.render_text("Oxygen Depleted or Suit Breached!", FONT_MEDIUM, FONT_SIZE_MD, NEON_WHITE)
         self.gm.screen.blit(message, (WIDTH // 2 - message.get_width() // 2, HEIGHT // 2 - 30))
         restart_button.update()
         restart_button.draw(self.gm.screen)
-        exit_text = font_md.render("Press ESC to exit", True, NEON_WHITE)
+        exit_text = resource_manager.render_text("Press ESC to exit", FONT_MEDIUM, FONT_SIZE_MD, NEON_WHITE)
         self.gm.screen.blit(exit_text, (WIDTH // 2 - exit_text.get_width() // 2, HEIGHT // 2 + 100))
-        self.stop_music()
 
     def draw_win_screen(self, restart_button):
         self.gm.screen.fill(NEON_BLACK)
-        for particle in self.particles:
-            particle.draw(self.gm.screen)
-        font_lg = pygame.font.Font(FONT_BOLD, FONT_SIZE_LG)
-        font_md = pygame.font.Font(FONT_MEDIUM, FONT_SIZE_MD)
-        title = font_lg.render("MISSION SUCCESS!", True, NEON_GREEN)
+        self.particles.draw(self.gm.screen)
+        title = resource_manager.render_text("MISSION SUCCESS!", FONT_BOLD, FONT_SIZE_LG, NEON_GREEN)
         self.gm.screen.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 2 - 80))
-        message = font_md.render("Distress Signal Sent!", True, NEON_WHITE)
+        message = resource_manager.render_text("Distress Signal Sent!", FONT_MEDIUM, FONT_SIZE_MD, NEON_WHITE)
         self.gm.screen.blit(message, (WIDTH // 2 - message.get_width() // 2, HEIGHT // 2 - 30))
         restart_button.update()
         restart_button.draw(self.gm.screen)
-        exit_text = font_md.render("Press ESC to exit", True, NEON_WHITE)
-        self.gm.screen.blit(exit_text, (WIDTH // 2 - exit_text.get_width() // 2, HEIGHT // 2 + 100))
-        self.stop_music()
\ No newline at end of file
+        exit_text = resource_manager.render_text("Press ESC to exit", FONT_MEDIUM, FONT_SIZE_MD, NEON_WHITE)
+        self.gm.screen.blit(exit_text, (WIDTH // 2 - exit_text.get_width() // 2, HEIGHT // 2 + 100))
\ No newline at end of file